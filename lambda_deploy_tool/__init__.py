@@ -6,22 +6,27 @@ KISS, DRY, SOLID principles applied
 
 __version__ = "2.0.0"
 
-# Re-export existing components
-from .deployer import Deployer
-from .config import DeployConfig
-from .args import DeploymentArgumentParser, parse_arguments
-from .builder import LambdaBuilder
-from .validators import (
-    AWSValidator,
-    LambdaPackageValidator,
-    EnvironmentVariableValidator
-)
-
-# New container components
-from .config_container import ContainerDeployConfig
-from .container_deployer import ContainerDeployer
-from .args_container import ContainerDeploymentArgumentParser
-from .builder_container import ContainerBuilder
+import importlib
+
+# Components are imported on first access (PEP 562), so parsing arguments or building a config
+# does not pay for boto3/botocore (most of the import time) until an AWS-facing class is used
+_EXPORTS = {
+    # Existing components
+    'Deployer': '.deployer',
+    'DeployConfig': '.config',
+    'DeploymentArgumentParser': '.args',
+    'parse_arguments': '.args',
+    'LambdaBuilder': '.builder',
+    'AWSValidator': '.validators',
+    'LambdaPackageValidator': '.validators',
+    'EnvironmentVariableValidator': '.validators',
+
+    # New container components
+    'ContainerDeployConfig': '.config_container',
+    'ContainerDeployer': '.container_deployer',
+    'ContainerDeploymentArgumentParser': '.args_container',
+    'ContainerBuilder': '.builder_container',
+}
 
 __all__ = [
     # Existing exports
@@ -39,4 +44,17 @@ __all__ = [
     'ContainerDeployer',
     'ContainerDeploymentArgumentParser',
     'ContainerBuilder',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -3,8 +3,13 @@
 Command line argument parsing for deployment - Class-based for extensibility
 """
 import argparse
+import copy
 import os
 from pathlib import Path
+from typing import Dict, Tuple
+
+# Fully populated parsers, shared between instances until one of them is customised
+_PARSER_CACHE: Dict[Tuple[type, str, str], argparse.ArgumentParser] = {}
 
 
 class DeploymentArgumentParser:
@@ -14,7 +19,25 @@ class DeploymentArgumentParser:
         self.script_name = script_name or os.path.basename(__file__)
         self.description = description or 'Deploy application to AWS Lambda'
         self.parser = None
-        self._initialize_parser()
+        self._owns_parser = True
+        self._load_parser()
+
+    def _load_parser(self):
+        """Reuse the parser already built for this class/script/description, building it once"""
+        key = (type(self), self.script_name, self.description)
+        cached = _PARSER_CACHE.get(key)
+        if cached is None:
+            self._initialize_parser()
+            _PARSER_CACHE[key] = self.parser
+        else:
+            self.parser = cached
+        self._owns_parser = False
+
+    def _own_parser(self):
+        """Copy the shared parser before the first customisation (copy-on-write)"""
+        if not self._owns_parser:
+            self.parser = copy.deepcopy(self.parser)
+            self._owns_parser = True
 
     def _initialize_parser(self):
         """Initialize the argument parser with base arguments"""
@@ -50,6 +73,23 @@ class DeploymentArgumentParser:
             default=Path('dist'),
             help='Output directory for build artifacts (default: dist/)'
         )
+        compression_group = build_group.add_mutually_exclusive_group()
+        compression_group.add_argument(
+            '--zip-level',
+            dest='compression_level',
+            type=int,
+            choices=range(10),
+            default=1,
+            metavar='{0-9}',
+            help='ZIP deflate level, higher is smaller but slower (default: 1)'
+        )
+        compression_group.add_argument(
+            '--no-compression',
+            dest='compression_level',
+            action='store_const',
+            const=0,
+            help='Store files in the ZIP uncompressed (fastest build, largest upload)'
+        )
 
     def _add_aws_arguments(self):
         """Add AWS-related arguments"""
@@ -105,6 +145,16 @@ class DeploymentArgumentParser:
             action='store_true',
             help='Show what would be deployed without making changes'
         )
+        other_group.add_argument(
+            '--concurrent',
+            action='store_true',
+            help='Run deployment steps in parallel as soon as the steps they depend on finish'
+        )
+        other_group.add_argument(
+            '--force-deploy',
+            action='store_true',
+            help='Redeploy even if package and configuration are unchanged'
+        )
         other_group.add_argument(
             '--skip-validation',
             action='store_true',
@@ -118,10 +168,12 @@ class DeploymentArgumentParser:
 
     def add_argument(self, *args, **kwargs):
         """Add custom argument - extensibility point"""
+        self._own_parser()
         self.parser.add_argument(*args, **kwargs)
 
     def add_argument_group(self, title: str, description: str = None):
         """Add a custom argument group"""
+        self._own_parser()
         return self.parser.add_argument_group(title, description)
 
     def parse_args(self):
@@ -10,8 +10,9 @@ from .args import DeploymentArgumentParser
 class ContainerDeploymentArgumentParser(DeploymentArgumentParser):
     """Argument parser for container Lambda deployment"""
 
-    def __init__(self, script_name: str = None, description: str = None):
-        super().__init__(script_name, description)
+    def _initialize_parser(self):
+        """Initialize the base arguments plus container-specific ones"""
+        super()._initialize_parser()
         self._add_container_arguments()
 
     def _add_container_arguments(self):
@@ -3,15 +3,75 @@
 AWS service managers - Simplified to avoid circular imports
 """
 
+import functools
 import logging
+import random
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# "Does not exist" answers are expected during existence checks, so never retry them
+_NOT_FOUND_CODES = frozenset({'NoSuchEntity', 'ResourceNotFoundException', 'NotFoundException', 'NotFound'})
+
+# How long existence checks and describe_* responses are trusted within one process
+CACHE_TTL_SECONDS = 60.0
+
+# Shared by every client: a pool big enough for the thread-pool fan-outs, kept-alive
+# connections so calls after the first skip the TLS handshake, and botocore's adaptive
+# retries (jittered backoff + client-side rate limiting) for throttling and transient errors.
+# Nagle is already off: botocore appends keepalive to urllib3's default TCP_NODELAY socket option.
+# A connect that stalls is retried after 5s instead of botocore's 60s; reads keep the default
+# because inline code uploads can legitimately take a while
+CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    connect_timeout=5,
+    retries={'mode': 'adaptive', 'max_attempts': 10}
+)
+
+_SESSION: Optional[boto3.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session() -> boto3.Session:
+    """Process-wide boto3 session, so credentials and service models are loaded once"""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = boto3.Session()
+    return _SESSION
+
+
+def create_client(service_name: str, region: str, session: Optional[boto3.Session] = None):
+    """Create a client from the shared (or given) session; sessions are not thread-safe, hence the lock"""
+    session = session or get_session()
+    with _SESSION_LOCK:
+        return session.client(service_name, region_name=region, config=CLIENT_CONFIG)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(service_name: str, region: str):
+    """Shared client per (service, region); clients are thread-safe, so every manager reuses one"""
+    return create_client(service_name, region)
+
+
+def _freeze(value: Any) -> Any:
+    """Make API kwargs hashable so they can be used as a cache key"""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
 
 class AWSServiceManager(ABC):
     """
@@ -23,6 +83,8 @@ class AWSServiceManager(ABC):
         self.region = region
         self.dry_run = dry_run
         self._client = None
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
 
     @property
     @abstractmethod
@@ -32,95 +94,191 @@ class AWSServiceManager(ABC):
 
     @property
     def client(self):
-        """Lazy-load boto3 client"""
+        """Lazy-load boto3 client (shared with other managers of the same service and region)"""
         if self._client is None:
-            self._client = boto3.client(self.service_name, region_name=self.region)
+            self._client = get_client(self.service_name, self.region)
         return self._client
 
     def safe_call(self, operation: str, **kwargs) -> Any:
         """
-        Safely call AWS API with error handling and retries
+        Safely call AWS API with error handling
+        Throttling and transient errors are retried inside botocore (adaptive mode, see CLIENT_CONFIG)
         """
-        return self.safe_call_with_retry(operation, **kwargs)
+        if self.dry_run:
+            logger.info("[DRY-RUN] Would call %s.%s", self.service_name, operation)
+            logger.debug("[DRY-RUN] Parameters: %s", kwargs)
+            return None
+
+        try:
+            response = getattr(self.client, operation)(**kwargs)
+            logger.debug("✅ %s.%s succeeded", self.service_name, operation)
+            return response
+
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code in _NOT_FOUND_CODES:
+                logger.debug("%s.%s: %s", self.service_name, operation, error_code)
+            else:
+                logger.error("❌ %s.%s failed: %s", self.service_name, operation, error_code)
+            raise
 
-    def safe_call_with_retry(self, operation: str, max_attempts: int = 3, base_delay: float = 1.0, **kwargs) -> Any:
+        except Exception as e:
+            logger.error("❌ %s.%s failed: %s", self.service_name, operation, e)
+            raise
+
+    def safe_call_with_retry(self, operation: str, retry_on: Iterable[str], max_attempts: int = 5,
+                             base_delay: float = 1.0, **kwargs) -> Any:
         """
-        Safely call AWS API with exponential backoff retry
+        safe_call that also retries error codes botocore treats as final but which resolve themselves,
+        e.g. NoSuchEntity right after creating an IAM role (equal-jitter exponential backoff)
         """
-        import time
-        last_exception = None
+        retry_on = frozenset(retry_on)
 
-        for attempt in range(max_attempts):
+        for attempt in range(max_attempts - 1):
             if self.dry_run:
-                logger.info(f"[DRY-RUN] Would call {self.service_name}.{operation}")
-                logger.debug(f"[DRY-RUN] Parameters: {kwargs}")
-                return None
+                break
 
             try:
-                method = getattr(self.client, operation)
-                response = method(**kwargs)
-                logger.debug(f"✅ {self.service_name}.{operation} succeeded (attempt {attempt + 1})")
-                return response
-
+                return getattr(self.client, operation)(**kwargs)
             except ClientError as e:
-                last_exception = e
                 error_code = e.response['Error']['Code']
-
-                # Don't retry on these errors
-                if error_code in ['AccessDenied', 'ValidationError', 'InvalidParameter']:
-                    logger.error(f"❌ {self.service_name}.{operation} failed: {error_code}")
+                if error_code not in retry_on:
+                    logger.error("❌ %s.%s failed: %s", self.service_name, operation, error_code)
                     raise
 
-                # Retry on throttling and server errors
-                if attempt < max_attempts - 1:
-                    delay = base_delay * (2 ** attempt)
-                    logger.warning(
-                        f"⚠️ {self.service_name}.{operation} failed with {error_code}, retrying in {delay}s...")
-                    time.sleep(delay)
-                else:
-                    logger.error(
-                        f"❌ {self.service_name}.{operation} failed after {max_attempts} attempts: {error_code}")
-                    raise
+                delay = self._retry_delay(e, attempt, base_delay)
+                logger.warning("⚠️ %s.%s failed with %s, retrying in %.1fs...",
+                               self.service_name, operation, error_code, delay)
+                time.sleep(delay)
 
-            except Exception as e:
-                last_exception = e
-                logger.error(f"❌ {self.service_name}.{operation} failed: {e}")
-                if attempt == max_attempts - 1:
-                    raise
+        return self.safe_call(operation, **kwargs)
+
+    def safe_call_parallel(self, *, calls: List[Tuple[str, dict]], max_workers: int = 4) -> List[Any]:
+        """
+        Run independent safe_calls concurrently, returning responses in call order
+        Callers must make sure the calls don't depend on each other (no data or ordering constraints)
+        All calls are awaited; failures are raised together as an ExceptionGroup (first failure on Python < 3.11)
+        """
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls) or 1)) as executor:
+            futures = [executor.submit(self.safe_call, operation, **kwargs) for operation, kwargs in calls]
+            errors = [future.exception() for future in futures]
+
+        failures = [error for error in errors if error is not None]
+        if failures:
+            if len(failures) == 1:
+                raise failures[0]
+            try:
+                raise ExceptionGroup(f"{len(failures)} {self.service_name} calls failed", failures)
+            except NameError:  # Python < 3.11
+                for error in failures[1:]:
+                    logger.error("❌ %s parallel call failed: %s", self.service_name, error)
+                raise failures[0]
+
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def _retry_delay(error: ClientError, attempt: int, base_delay: float) -> float:
+        """
+        Backoff before the next attempt: honour an explicit Retry-After from AWS,
+        otherwise equal jitter so concurrent retries don't hit the rate limit in lockstep
+        """
+        headers = error.response.get('ResponseMetadata', {}).get('HTTPHeaders', {})
+        retry_after = headers.get('retry-after') or headers.get('x-amzn-retryafter')
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass  # HTTP-date form; fall back to our own backoff
 
-        raise last_exception
+        ceiling = base_delay * (2 ** attempt)
+        return ceiling / 2 + random.uniform(0, ceiling / 2)
+
+    def _cache_get(self, key: Tuple) -> Tuple[bool, Any]:
+        """Return (hit, value) for a cache key, dropping expired entries"""
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return False, None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._cache[key]
+                return False, None
+            return True, value
+
+    def _cache_put(self, key: Tuple, value: Any) -> None:
+        with self._cache_lock:
+            self._cache[key] = (time.monotonic() + CACHE_TTL_SECONDS, value)
+
+    def cached_call(self, operation: str, **kwargs) -> Any:
+        """safe_call for read-only describe/get operations, memoized for CACHE_TTL_SECONDS"""
+        key = ('call', operation, _freeze(kwargs))
+        hit, response = self._cache_get(key)
+        if hit:
+            logger.debug("%s.%s served from cache", self.service_name, operation)
+            return response
+
+        response = self.safe_call(operation, **kwargs)
+        self._cache_put(key, response)
+        return response
+
+    def invalidate_cache(self, operation: str, **kwargs) -> None:
+        """Forget cached results for an operation after the resource was changed"""
+        frozen = _freeze(kwargs)
+        with self._cache_lock:
+            self._cache.pop(('call', operation, frozen), None)
+            self._cache.pop(('exists', operation, frozen), None)
+
+    def mark_exists(self, check_operation: str, **kwargs) -> None:
+        """Record that a resource now exists (e.g. right after creating it)"""
+        self.invalidate_cache(check_operation, **kwargs)
+        self._cache_put(('exists', check_operation, _freeze(kwargs)), True)
 
     def resource_exists(self, check_operation: str, **kwargs) -> bool:
         """
         Check if AWS resource exists with proper error handling
+        Results are cached for CACHE_TTL_SECONDS
         """
+        key = ('exists', check_operation, _freeze(kwargs))
+        hit, exists = self._cache_get(key)
+        if hit:
+            return exists
+
         try:
             self.safe_call(check_operation, **kwargs)
-            return True
+            exists = True
         except ClientError as e:
-            if e.response['Error']['Code'] in ['NoSuchEntity', 'ResourceNotFoundException', 'NotFoundException']:
-                return False
-            raise
+            if e.response['Error']['Code'] not in _NOT_FOUND_CODES:
+                raise
+            exists = False
 
-    def wait_for_resource(self, waiter_name: str, max_attempts: int = 40, **kwargs) -> bool:
+        self._cache_put(key, exists)
+        return exists
+
+    def wait_for_resource(self, waiter_name: str, max_attempts: int = 40, delay: Optional[float] = None,
+                          **kwargs) -> bool:
         """
         Wait for AWS resource to be ready with timeout handling
+        delay overrides the waiter's default polling interval (seconds)
         """
         if self.dry_run:
-            logger.info(f"[DRY-RUN] Would wait for {waiter_name}")
+            logger.info("[DRY-RUN] Would wait for %s", waiter_name)
             return True
 
+        waiter_config = {'MaxAttempts': max_attempts}
+        if delay is not None:
+            waiter_config['Delay'] = delay
+
         try:
             waiter = self.client.get_waiter(waiter_name)
             waiter.wait(
-                WaiterConfig={'MaxAttempts': max_attempts},
+                WaiterConfig=waiter_config,
                 **kwargs
             )
             return True
         except Exception as e:
-            logger.error(f"❌ Waiting for {waiter_name} failed: {e}")
+            logger.error("❌ Waiting for %s failed: %s", waiter_name, e)
             return False
 
 
 # Remove the problematic imports - let each file import managers explicitly
-__all__ = ['AWSServiceManager']
\ No newline at end of file
+__all__ = ['AWSServiceManager', 'get_session', 'create_client', 'get_client']
\ No newline at end of file
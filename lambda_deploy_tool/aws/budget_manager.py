@@ -6,13 +6,45 @@ Single Responsibility: Manage AWS Budgets with enforcement
 import json
 import logging
 
-import boto3
 from botocore.exceptions import ClientError
 
-from . import AWSServiceManager
+from . import AWSServiceManager, get_client
+from ..cache import load_json, save_json
 
 logger = logging.getLogger(__name__)
 
+# Local cache of SubscriptionArns keyed "topic_arn|email", so checks are one O(1) call
+_SUBSCRIPTION_CACHE_FILE = 'sns-subscriptions.json'
+
+# Invariant parts of the budget definition; only name, amount and topic vary per call
+_COST_FILTERS = {
+    'Service': ['Amazon Lambda', 'Amazon EventBridge Scheduler']
+}
+
+_COST_TYPES = {
+    'IncludeCredit': False,
+    'IncludeDiscount': True,
+    'IncludeOtherSubscription': True,
+    'IncludeRecurring': True,
+    'IncludeRefund': False,
+    'IncludeSubscription': True,
+    'IncludeSupport': True,
+    'IncludeTax': True,
+    'IncludeUpfront': True,
+    'UseBlended': False
+}
+
+# 80%: email warning, 100%: function gets disabled
+_NOTIFICATIONS = tuple(
+    {
+        'NotificationType': 'ACTUAL',
+        'ComparisonOperator': 'GREATER_THAN',
+        'Threshold': threshold,
+        'ThresholdType': 'PERCENTAGE'
+    }
+    for threshold in (80, 100)
+)
+
 
 class BudgetManager(AWSServiceManager):
     """Manages AWS Budgets with cost enforcement (SRP)"""
@@ -25,12 +57,13 @@ class BudgetManager(AWSServiceManager):
         super().__init__(region, dry_run)
         self.account_id = account_id
         self._sns_client = None
+        self._subscribed = set()
 
     @property
     def sns_client(self):
         """Lazy-load SNS client"""
         if self._sns_client is None:
-            self._sns_client = boto3.client('sns', region_name=self.region)
+            self._sns_client = get_client('sns', self.region)
         return self._sns_client
 
     def setup_budget_enforcement(
@@ -42,7 +75,7 @@ class BudgetManager(AWSServiceManager):
             sns_topic_name: str = None
     ) -> None:
         """Setup complete budget enforcement with email alerts"""
-        logger.info(f"💰 Setting up budget enforcement: ${budget_limit}/month")
+        logger.info("💰 Setting up budget enforcement: $%s/month", budget_limit)
 
         # Use provided topic name or default to budget_name based
         if not sns_topic_name:
@@ -50,7 +83,7 @@ class BudgetManager(AWSServiceManager):
             safe_name = budget_name.lower().replace(' ', '-').replace('_', '-')
             sns_topic_name = f"{safe_name}-alerts"
 
-        logger.info(f"📧 Using SNS topic: {sns_topic_name}")
+        logger.info("📧 Using SNS topic: %s", sns_topic_name)
 
         # Create SNS topic and subscribe email
         topic_arn = self._ensure_sns_topic(email, sns_topic_name)
@@ -61,59 +94,103 @@ class BudgetManager(AWSServiceManager):
         )
 
         logger.info("✅ Budget enforcement configured")
-        logger.info(f"   • 80% threshold: Email warning to {email}")
-        logger.info(f"   • 100% threshold: Lambda function AUTOMATICALLY DISABLED")
+        logger.info("   • 80%% threshold: Email warning to %s", email)
+        logger.info("   • 100%% threshold: Lambda function AUTOMATICALLY DISABLED by %s", budget_name)
 
     def _ensure_sns_topic(self, email: str, topic_name: str) -> str:
         """Ensure SNS topic exists and email is subscribed"""
         topic_arn = f"arn:aws:sns:{self.region}:{self.account_id}:{topic_name}"
 
-        logger.info(f"Setting up SNS topic: {topic_name}...")
+        logger.info("Setting up SNS topic: %s...", topic_name)
 
         # Create topic if it doesn't exist
         try:
             self.sns_client.get_topic_attributes(TopicArn=topic_arn)
-            logger.info(f"✅ SNS topic exists: {topic_name}")
+            logger.info("✅ SNS topic exists: %s", topic_name)
         except ClientError as e:
             if e.response['Error']['Code'] == 'NotFound':
                 if not self.dry_run:
                     self.sns_client.create_topic(Name=topic_name)
-                logger.info(f"✅ Created SNS topic: {topic_name}")
+                logger.info("✅ Created SNS topic: %s", topic_name)
             else:
                 raise
 
         # Subscribe email if not already subscribed
         if not self._is_email_subscribed(topic_arn, email):
             if not self.dry_run:
-                self.sns_client.subscribe(
+                response = self.sns_client.subscribe(
                     TopicArn=topic_arn,
                     Protocol='email',
-                    Endpoint=email
+                    Endpoint=email,
+                    ReturnSubscriptionArn=True
                 )
-            logger.info(f"✅ Subscribed {email} to budget alerts")
-            logger.info(f"📧 Confirmation email sent to {email} - PLEASE CONFIRM")
+                self._remember_subscription(topic_arn, email, response['SubscriptionArn'])
+                self._subscribed.add((topic_arn, email))
+            logger.info("✅ Subscribed %s to budget alerts", email)
+            logger.info("📧 Confirmation email sent to %s - PLEASE CONFIRM", email)
         else:
-            logger.info(f"✅ Email already subscribed: {email}")
+            logger.info("✅ Email already subscribed: %s", email)
 
         return topic_arn
 
     def _is_email_subscribed(self, topic_arn: str, email: str) -> bool:
-        """Check if email is already subscribed to topic"""
+        """
+        Check if email has a confirmed subscription to topic
+        Uses the cached SubscriptionArn when known, else scans all pages (stopping at the first match)
+        Pending subscriptions count as not subscribed, so a fresh confirmation email is sent
+        """
         if self.dry_run:
             return False
 
-        try:
-            response = self.sns_client.list_subscriptions_by_topic(TopicArn=topic_arn)
-            subscriptions = response.get('Subscriptions', [])
+        key = (topic_arn, email)
+        if key in self._subscribed:
+            return True
 
-            for sub in subscriptions:
-                if sub.get('Endpoint') == email:
-                    return True
+        cached_arn = load_json(_SUBSCRIPTION_CACHE_FILE).get(f"{topic_arn}|{email}")
+        if cached_arn:
+            try:
+                attributes = self.sns_client.get_subscription_attributes(SubscriptionArn=cached_arn)['Attributes']
+                if attributes.get('PendingConfirmation') == 'true':
+                    return False
+                self._subscribed.add(key)
+                return True
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'NotFound':
+                    raise
+                # Subscription was removed; fall back to the scan below
 
-            return False
-        except Exception:
+        try:
+            paginator = self.sns_client.get_paginator('list_subscriptions_by_topic')
+            subscription_arn = next(
+                (
+                    sub.get('SubscriptionArn')
+                    for page in paginator.paginate(TopicArn=topic_arn)
+                    for sub in page.get('Subscriptions', [])
+                    if sub.get('Endpoint') == email
+                ),
+                None
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NotFound':
+                return False
+            raise
+
+        # Unconfirmed subscriptions are listed with the placeholder ARN 'PendingConfirmation'
+        if not subscription_arn or not subscription_arn.startswith('arn:'):
             return False
 
+        # Subscriptions only change through this class, so a positive answer stays valid
+        self._remember_subscription(topic_arn, email, subscription_arn)
+        self._subscribed.add(key)
+        return True
+
+    @staticmethod
+    def _remember_subscription(topic_arn: str, email: str, subscription_arn: str) -> None:
+        """Persist a SubscriptionArn for the next run's O(1) check"""
+        subscriptions = load_json(_SUBSCRIPTION_CACHE_FILE)
+        subscriptions[f"{topic_arn}|{email}"] = subscription_arn
+        save_json(_SUBSCRIPTION_CACHE_FILE, subscriptions)
+
     def _ensure_budget_with_notifications(
             self,
             budget_name: str,
@@ -122,7 +199,7 @@ class BudgetManager(AWSServiceManager):
             budget_action_role_arn: str
     ) -> None:
         """Create or update budget with notifications and actions"""
-        logger.info(f"Configuring budget: {budget_name}")
+        logger.info("Configuring budget: %s", budget_name)
 
         budget_definition = {
             'BudgetName': budget_name,
@@ -130,69 +207,26 @@ class BudgetManager(AWSServiceManager):
                 'Amount': str(budget_limit),
                 'Unit': 'USD'
             },
-            'CostFilters': {
-                'Service': ['Amazon Lambda', 'Amazon EventBridge Scheduler']
-            },
-            'CostTypes': {
-                'IncludeCredit': False,
-                'IncludeDiscount': True,
-                'IncludeOtherSubscription': True,
-                'IncludeRecurring': True,
-                'IncludeRefund': False,
-                'IncludeSubscription': True,
-                'IncludeSupport': True,
-                'IncludeTax': True,
-                'IncludeUpfront': True,
-                'UseBlended': False
-            },
+            'CostFilters': _COST_FILTERS,
+            'CostTypes': _COST_TYPES,
             'TimeUnit': 'MONTHLY',
             'BudgetType': 'COST'
         }
 
         notifications = [
-            {
-                'Notification': {
-                    'NotificationType': 'ACTUAL',
-                    'ComparisonOperator': 'GREATER_THAN',
-                    'Threshold': 80,
-                    'ThresholdType': 'PERCENTAGE'
-                },
-                'Subscribers': [{
-                    'SubscriptionType': 'SNS',
-                    'Address': sns_topic_arn
-                }]
-            },
-            {
-                'Notification': {
-                    'NotificationType': 'ACTUAL',
-                    'ComparisonOperator': 'GREATER_THAN',
-                    'Threshold': 100,
-                    'ThresholdType': 'PERCENTAGE'
-                },
-                'Subscribers': [{
-                    'SubscriptionType': 'SNS',
-                    'Address': sns_topic_arn
-                }]
-            }
+            {'Notification': notification, 'Subscribers': [{'SubscriptionType': 'SNS', 'Address': sns_topic_arn}]}
+            for notification in _NOTIFICATIONS
         ]
 
-        if self._budget_exists(budget_name):
+        # Budgets usually exist already: update first, create only when AWS says it's missing
+        # (one round trip on the warm path instead of describe + update)
+        try:
             self._update_budget(budget_name, budget_definition)
-        else:
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'NotFoundException':
+                raise
             self._create_budget(budget_name, budget_definition, notifications)
 
-    def _budget_exists(self, budget_name: str) -> bool:
-        """Check if budget exists"""
-        try:
-            self.safe_call(
-                'describe_budget',
-                AccountId=self.account_id,
-                BudgetName=budget_name
-            )
-            return True
-        except Exception:
-            return False
-
     def _create_budget(
             self,
             budget_name: str,
@@ -209,7 +243,8 @@ class BudgetManager(AWSServiceManager):
             NotificationsWithSubscribers=notifications
         )
 
-        logger.info(f"✅ Budget created: {budget_name}")
+        self.invalidate_cache('describe_budget', AccountId=self.account_id, BudgetName=budget_name)
+        logger.info("✅ Budget created: %s", budget_name)
 
     def _update_budget(self, budget_name: str, budget_definition: dict) -> None:
         """Update existing budget"""
@@ -221,4 +256,5 @@ class BudgetManager(AWSServiceManager):
             NewBudget=budget_definition
         )
 
-        logger.info(f"✅ Budget updated: {budget_name}")
\ No newline at end of file
+        self.invalidate_cache('describe_budget', AccountId=self.account_id, BudgetName=budget_name)
+        logger.info("✅ Budget updated: %s", budget_name)
\ No newline at end of file
@@ -5,15 +5,24 @@ ECR Repository Manager
 import logging
 import base64
 import json
+import time
+from typing import Optional, Tuple
 
 from . import AWSServiceManager
 
 logger = logging.getLogger(__name__)
 
+# Refresh the (12h) ECR token this many seconds before it actually expires
+TOKEN_EXPIRY_MARGIN = 300
+
 
 class ECRManager(AWSServiceManager):
     """Manages ECR repositories for container Lambda"""
 
+    def __init__(self, region: str, dry_run: bool = False):
+        super().__init__(region, dry_run)
+        self._auth_cache: Optional[Tuple[dict, float]] = None
+
     @property
     def service_name(self) -> str:
         return 'ecr'
@@ -25,28 +34,28 @@ class ECRManager(AWSServiceManager):
         Returns:
             Repository URI (e.g., account.dkr.ecr.region.amazonaws.com/repo)
         """
-        logger.info(f"📦 Setting up ECR repository: {repository_name}")
+        logger.info("📦 Setting up ECR repository: %s", repository_name)
 
         if self.dry_run:
             # Return a mock repository URI for dry-run
             mock_uri = f"123456789012.dkr.ecr.{self.region}.amazonaws.com/{repository_name}"
-            logger.info(f"[DRY-RUN] Would ensure ECR repository: {repository_name}")
-            logger.info(f"[DRY-RUN] Mock repository URI: {mock_uri}")
+            logger.info("[DRY-RUN] Would ensure ECR repository: %s", repository_name)
+            logger.info("[DRY-RUN] Mock repository URI: %s", mock_uri)
             return mock_uri
 
         try:
             # Check if repository exists
-            response = self.safe_call(
+            response = self.cached_call(
                 'describe_repositories',
                 repositoryNames=[repository_name]
             )
             repo_uri = response['repositories'][0]['repositoryUri']
-            logger.info(f"✅ ECR repository exists: {repo_uri}")
+            logger.info("✅ ECR repository exists: %s", repo_uri)
             return repo_uri
 
         except self.client.exceptions.RepositoryNotFoundException:
             # Create repository if it doesn't exist
-            logger.info(f"Creating ECR repository: {repository_name}")
+            logger.info("Creating ECR repository: %s", repository_name)
             response = self.safe_call(
                 'create_repository',
                 repositoryName=repository_name,
@@ -56,7 +65,7 @@ class ECRManager(AWSServiceManager):
                 }
             )
             repo_uri = response['repository']['repositoryUri']
-            logger.info(f"✅ Created ECR repository: {repo_uri}")
+            logger.info("✅ Created ECR repository: %s", repo_uri)
             return repo_uri
 
     def get_authorization_token(self) -> dict:
@@ -75,21 +84,26 @@ class ECRManager(AWSServiceManager):
                 'password': 'dry-run-token',
                 'registry': f'123456789012.dkr.ecr.{self.region}.amazonaws.com'
             }
-            logger.info(f"[DRY-RUN] Would get ECR authorization token")
+            logger.info("[DRY-RUN] Would get ECR authorization token")
             return mock_auth
 
+        if self._auth_cache and time.time() < self._auth_cache[1] - TOKEN_EXPIRY_MARGIN:
+            logger.debug("Using cached ECR authorization token")
+            return self._auth_cache[0]
+
         response = self.safe_call('get_authorization_token')
         auth_data = response['authorizationData'][0]
 
-        # Decode authorization token
-        auth_token = base64.b64decode(auth_data['authorizationToken']).decode()
-        username, password = auth_token.split(':')
+        # Decode authorization token ("user:password", split on the raw bytes)
+        username, _, password = base64.b64decode(auth_data['authorizationToken']).partition(b':')
 
         auth_info = {
-            'username': username,
-            'password': password,
-            'registry': auth_data['proxyEndpoint'].replace('https://', '')
+            'username': username.decode(),
+            'password': password.decode(),
+            'registry': auth_data['proxyEndpoint'].removeprefix('https://')
         }
 
-        logger.debug(f"✅ Got ECR authorization for {auth_info['registry']}")
+        self._auth_cache = (auth_info, auth_data['expiresAt'].timestamp())
+
+        logger.debug("✅ Got ECR authorization for %s", auth_info['registry'])
         return auth_info
\ No newline at end of file
@@ -3,14 +3,73 @@
 IAM Role and Policy Manager
 Single Responsibility: Manage IAM resources for Lambda
 """
+import functools
 import json
 import logging
-import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 from . import AWSServiceManager
 
 logger = logging.getLogger(__name__)
 
+# Policies go over the wire and count against IAM's size limits, so skip the whitespace
+_compact_dumps = functools.partial(json.dumps, separators=(',', ':'))
+
+LAMBDA_BASIC_EXECUTION_POLICY_ARN = 'arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole'
+
+# IAM is eventually consistent: a role that was just created may briefly look missing
+_PROPAGATION_ERRORS = ('NoSuchEntity', 'AccessDenied')
+
+# Invariant policy documents, serialized once at import
+_LAMBDA_TRUST_POLICY_JSON = _compact_dumps({
+    "Version": "2012-10-17",
+    "Statement": [{
+        "Effect": "Allow",
+        "Principal": {"Service": "lambda.amazonaws.com"},
+        "Action": "sts:AssumeRole"
+    }]
+})
+
+_BUDGETS_TRUST_POLICY_JSON = _compact_dumps({
+    "Version": "2012-10-17",
+    "Statement": [{
+        "Effect": "Allow",
+        "Principal": {"Service": "budgets.amazonaws.com"},
+        "Action": "sts:AssumeRole"
+    }]
+})
+
+_BUDGET_ACTION_POLICY = {
+    "Version": "2012-10-17",
+    "Statement": [{
+        "Effect": "Allow",
+        "Action": [
+            "lambda:UpdateFunctionConfiguration",
+            "scheduler:UpdateSchedule",
+            "sns:Publish"
+        ],
+        "Resource": "*"
+    }]
+}
+
+
+def _scheduler_trust_policy_json(account_id: str) -> str:
+    """Scheduler trust policy, restricted to schedules in our own account"""
+    return _compact_dumps({
+        "Version": "2012-10-17",
+        "Statement": [{
+            "Effect": "Allow",
+            "Principal": {"Service": "scheduler.amazonaws.com"},
+            "Action": "sts:AssumeRole",
+            "Condition": {
+                "StringEquals": {
+                    "aws:SourceAccount": account_id
+                }
+            }
+        }]
+    })
+
 
 class IAMManager(AWSServiceManager):
     """Manages IAM roles and policies for Lambda (SRP)"""
@@ -19,48 +78,76 @@ class IAMManager(AWSServiceManager):
     def service_name(self) -> str:
         return 'iam'
 
+    def ensure_all_roles(self, specs: List[Tuple[str, str, dict]]) -> Dict[str, str]:
+        """
+        Ensure several independent roles concurrently
+
+        Args:
+            specs: (kind, role_name, kwargs) tuples; kind is 'lambda', 'budget_action' or 'scheduler'
+                   and kwargs are passed to the matching ensure_* method
+
+        Returns:
+            dict of role name -> role ARN
+        """
+        handlers = {
+            'lambda': self.ensure_lambda_role,
+            'budget_action': self._ensure_budget_action_role_with_policy,
+            'scheduler': self.ensure_scheduler_role,
+        }
+        for kind, role_name, _ in specs:
+            if kind not in handlers:
+                raise ValueError(f"Unknown role kind '{kind}' for role {role_name}")
+
+        # Each role is a chain of IAM round trips with no dependency on the others
+        with ThreadPoolExecutor(max_workers=min(8, len(specs) or 1)) as executor:
+            futures = {
+                role_name: executor.submit(handlers[kind], role_name, **kwargs)
+                for kind, role_name, kwargs in specs
+            }
+            return {role_name: future.result() for role_name, future in futures.items()}
+
+    def _ensure_budget_action_role_with_policy(self, role_name: str, account_id: str) -> str:
+        """Ensure budget action role exists and carries the budget action policy"""
+        role_arn = self.ensure_budget_action_role(role_name, account_id)
+        self.attach_budget_action_policy(role_name)
+        return role_arn
+
     def ensure_lambda_role(self, role_name: str, account_id: str) -> str:
         """
         Ensure Lambda execution role exists
         Returns role ARN
         """
-        logger.info(f"Setting up IAM role: {role_name}")
+        logger.info("Setting up IAM role: %s", role_name)
 
         role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
 
         if self.resource_exists('get_role', RoleName=role_name):
-            logger.info(f"✅ IAM role already exists: {role_name}")
+            logger.info("✅ IAM role already exists: %s", role_name)
             return role_arn
 
         # Create role
-        trust_policy = {
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Principal": {"Service": "lambda.amazonaws.com"},
-                "Action": "sts:AssumeRole"
-            }]
-        }
-
         self.safe_call(
             'create_role',
             RoleName=role_name,
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            AssumeRolePolicyDocument=_LAMBDA_TRUST_POLICY_JSON,
             Description='Execution role for Lambda function'
         )
-        logger.info(f"✅ Created IAM role: {role_name}")
+        self.mark_exists('get_role', RoleName=role_name)
+        logger.info("✅ Created IAM role: %s", role_name)
 
-        # Attach basic execution policy
-        self.safe_call(
+        # Attach basic execution policy right away, retrying briefly while the new role propagates
+        self.safe_call_with_retry(
             'attach_role_policy',
+            retry_on=_PROPAGATION_ERRORS,
+            max_attempts=5,
+            base_delay=0.5,
             RoleName=role_name,
-            PolicyArn='arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole'
+            PolicyArn=LAMBDA_BASIC_EXECUTION_POLICY_ARN
         )
         logger.info("✅ Attached AWSLambdaBasicExecutionRole")
 
-        # Wait for role to be available
-        if not self.dry_run:
-            time.sleep(10)
+        # Wait for role to be available (returns as soon as IAM reports it)
+        self.wait_for_resource('role_exists', max_attempts=20, delay=1, RoleName=role_name)
 
         return role_arn
 
@@ -73,50 +160,50 @@ class IAMManager(AWSServiceManager):
             policy_name: Name for the inline policy
             policy_document: IAM policy document as dict
         """
-        logger.info(f"Attaching inline policy '{policy_name}' to role '{role_name}'...")
+        document_json = _compact_dumps(policy_document)
 
-        self.safe_call(
+        # PutRolePolicy with a document this manager attached moments ago would change nothing
+        key = ('put_role_policy', role_name, policy_name, document_json)
+        if self._cache_get(key)[0]:
+            logger.info("✅ Inline policy '%s' already attached", policy_name)
+            return
+
+        logger.info("Attaching inline policy '%s' to role '%s'...", policy_name, role_name)
+
+        self.safe_call_with_retry(
             'put_role_policy',
+            retry_on=_PROPAGATION_ERRORS,
+            max_attempts=5,
+            base_delay=0.5,
             RoleName=role_name,
             PolicyName=policy_name,
-            PolicyDocument=json.dumps(policy_document)
+            PolicyDocument=document_json
         )
-        logger.info(f"✅ Inline policy '{policy_name}' attached")
-
-        # Wait for policy to propagate
-        if not self.dry_run:
-            time.sleep(5)
+        self._cache_put(key, True)
+        logger.info("✅ Inline policy '%s' attached", policy_name)
 
     def ensure_budget_action_role(self, role_name: str, account_id: str) -> str:
         """
         Ensure budget action role exists
         Returns role ARN
         """
-        logger.info(f"Setting up budget action role: {role_name}")
+        logger.info("Setting up budget action role: %s", role_name)
 
         role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
 
         if self.resource_exists('get_role', RoleName=role_name):
-            logger.info(f"✅ Budget action role already exists: {role_name}")
+            logger.info("✅ Budget action role already exists: %s", role_name)
             return role_arn
 
         # Create role
-        trust_policy = {
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Principal": {"Service": "budgets.amazonaws.com"},
-                "Action": "sts:AssumeRole"
-            }]
-        }
-
         self.safe_call(
             'create_role',
             RoleName=role_name,
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            AssumeRolePolicyDocument=_BUDGETS_TRUST_POLICY_JSON,
             Description='Role for budget enforcement actions'
         )
-        logger.info(f"✅ Created budget action role: {role_name}")
+        self.mark_exists('get_role', RoleName=role_name)
+        logger.info("✅ Created budget action role: %s", role_name)
 
         return role_arn
 
@@ -124,62 +211,31 @@ class IAMManager(AWSServiceManager):
         """Attach budget action policy to role"""
         logger.info("Setting up budget action policy...")
 
-        policy_name = 'budget-actions'
-        policy_document = {
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Action": [
-                    "lambda:UpdateFunctionConfiguration",
-                    "scheduler:UpdateSchedule",
-                    "sns:Publish"
-                ],
-                "Resource": "*"
-            }]
-        }
-
-        self.attach_inline_policy(role_name, policy_name, policy_document)
+        self.attach_inline_policy(role_name, 'budget-actions', _BUDGET_ACTION_POLICY)
         logger.info("✅ Budget action policy attached")
 
-        # Wait for policy to propagate
-        if not self.dry_run:
-            time.sleep(10)
-
     def ensure_scheduler_role(self, role_name: str, account_id: str, function_name: str) -> str:
         """
         Ensure EventBridge Scheduler role exists
         Returns role ARN
         """
-        logger.info(f"Setting up scheduler role: {role_name}")
+        logger.info("Setting up scheduler role: %s", role_name)
 
         role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
 
         if self.resource_exists('get_role', RoleName=role_name):
-            logger.info(f"✅ Scheduler role already exists: {role_name}")
+            logger.info("✅ Scheduler role already exists: %s", role_name)
             return role_arn
 
         # Create role
-        trust_policy = {
-            "Version": "2012-10-17",
-            "Statement": [{
-                "Effect": "Allow",
-                "Principal": {"Service": "scheduler.amazonaws.com"},
-                "Action": "sts:AssumeRole",
-                "Condition": {
-                    "StringEquals": {
-                        "aws:SourceAccount": account_id
-                    }
-                }
-            }]
-        }
-
         self.safe_call(
             'create_role',
             RoleName=role_name,
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            AssumeRolePolicyDocument=_scheduler_trust_policy_json(account_id),
             Description='Role for EventBridge Scheduler to invoke Lambda'
         )
-        logger.info(f"✅ Created scheduler role: {role_name}")
+        self.mark_exists('get_role', RoleName=role_name)
+        logger.info("✅ Created scheduler role: %s", role_name)
 
         # Attach policy
         policy_name = 'schedule-policy'
@@ -195,8 +251,7 @@ class IAMManager(AWSServiceManager):
         self.attach_inline_policy(role_name, policy_name, policy_document)
         logger.info("✅ Scheduler policy attached")
 
-        # Wait for role to be available
-        if not self.dry_run:
-            time.sleep(5)
+        # Wait for role to be available (returns as soon as IAM reports it)
+        self.wait_for_resource('role_exists', max_attempts=20, delay=1, RoleName=role_name)
 
         return role_arn
\ No newline at end of file
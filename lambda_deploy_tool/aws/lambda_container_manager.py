@@ -29,10 +29,13 @@ class ContainerLambdaManager(LambdaManager):
         Returns:
             Function ARN
         """
-        logger.info(f"🚢 Deploying container Lambda: {function_name}")
-        logger.info(f"  Image: {image_uri}")
-        logger.info(f"  Memory: {memory_size}MB")
-        logger.info(f"  Timeout: {timeout}s")
+        logger.info("🚢 Deploying container Lambda: %s", function_name)
+        logger.info("  Image: %s", image_uri)
+        logger.info("  Memory: %sMB", memory_size)
+        logger.info("  Timeout: %ss", timeout)
+
+        # Fail on bad parameters before calling AWS
+        self._validate_lambda_parameters(timeout, memory_size)
 
         # Set default architectures
         if architectures is None:
@@ -63,10 +66,8 @@ class ContainerLambdaManager(LambdaManager):
         """Create new container-based Lambda function"""
         logger.info("Creating new container Lambda function...")
 
-        # Validate parameters
-        self._validate_lambda_parameters(timeout, memory_size)
-
-        response = self.safe_call_with_retry(
+        # A role created moments ago may not be assumable by Lambda yet
+        response = self._call_until_role_assumable(
             'create_function',
             FunctionName=function_name,
             Role=role_arn,
@@ -80,8 +81,7 @@ class ContainerLambdaManager(LambdaManager):
                 'DeploymentType': 'container',
                 'ManagedBy': 'lambda-deploy-tool',
                 'ImageUri': image_uri
-            },
-            max_attempts=3
+            }
         )
 
         if self.dry_run:
@@ -90,7 +90,7 @@ class ContainerLambdaManager(LambdaManager):
         # Wait for function to be active
         self._wait_for_function_active(function_name)
 
-        logger.info(f"✅ Container Lambda created: {function_name}")
+        logger.info("✅ Container Lambda created: %s", function_name)
         return response['FunctionArn']
 
     def _update_container_function(
@@ -104,38 +104,36 @@ class ContainerLambdaManager(LambdaManager):
         """Update existing container-based Lambda function"""
         logger.info("Updating container Lambda function...")
 
-        # Validate parameters
-        self._validate_lambda_parameters(timeout, memory_size)
-
         try:
-            # Update container image
-            code_response = self.safe_call_with_retry(
-                'update_function_code',
-                FunctionName=function_name,
-                ImageUri=image_uri,
-                max_attempts=3
-            )
+            # Update container image, reading the live configuration at the same time
+            code_response, current_configuration = self.safe_call_parallel(calls=[
+                ('update_function_code', {'FunctionName': function_name, 'ImageUri': image_uri}),
+                ('get_function_configuration', {'FunctionName': function_name}),
+            ])
 
             if not self.dry_run:
                 # Wait for code update to complete
                 self._wait_for_function_updated(function_name)
 
+            if self._configuration_matches(current_configuration, env_vars, timeout, memory_size):
+                logger.info("✅ Configuration unchanged, skipping configuration update")
+                return code_response['FunctionArn']
+
             # Update configuration
-            config_response = self.safe_call_with_retry(
+            config_response = self.safe_call(
                 'update_function_configuration',
                 FunctionName=function_name,
                 Environment={'Variables': env_vars},
                 Timeout=timeout,
-                MemorySize=memory_size,
-                max_attempts=3
+                MemorySize=memory_size
             )
 
             if self.dry_run:
                 return f"arn:aws:lambda:{self.region}:000000000000:function:{function_name}"
 
-            logger.info(f"✅ Container Lambda updated: {function_name}")
+            logger.info("✅ Container Lambda updated: %s", function_name)
             return code_response['FunctionArn']
 
         except Exception as e:
-            logger.error(f"❌ Failed to update container Lambda: {e}")
+            logger.error("❌ Failed to update container Lambda: %s", e)
             raise
\ No newline at end of file
@@ -2,16 +2,37 @@
 """
 Lambda Function Manager with explicit imports and enhanced error handling
 """
+import base64
+import contextlib
+import json
 import logging
+import mmap
 import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from botocore.exceptions import ClientError, WaiterError
 
 # Explicit import to avoid circular dependencies
 from . import AWSServiceManager
+from .s3_manager import S3Manager
+from ..builder import file_sha256
 
 logger = logging.getLogger(__name__)
 
+# Lambda configuration limits
+MIN_TIMEOUT = 1
+MAX_TIMEOUT = 900
+MIN_MEMORY = 128
+MAX_MEMORY = 10240
+MEMORY_STEP = 64
+
+# Packages above this go through S3 (when a bucket is known) instead of inline ZipFile bytes
+S3_UPLOAD_THRESHOLD_MB = 10
+
+# Function tag recording the hash of the package + configuration last deployed
+SOURCE_HASH_TAG = 'deploy:source-hash'
+
 
 class LambdaManager(AWSServiceManager):
     """Manages Lambda function deployment with enhanced error handling"""
@@ -29,47 +50,93 @@ class LambdaManager(AWSServiceManager):
             timeout: int,
             memory_size: int,
             env_vars: dict,
-            package_path: Path
+            package_path: Path,
+            s3_bucket: Optional[str] = None,
+            s3_key: Optional[str] = None,
+            architectures: Optional[List[str]] = None
     ) -> str:
         """
         Deploy Lambda function with comprehensive error handling
+        If s3_bucket/s3_key are given, Lambda pulls the (already uploaded) package from S3;
+        with only s3_bucket, packages over S3_UPLOAD_THRESHOLD_MB are uploaded there first
         Returns function ARN
         """
-        logger.info(f"Deploying Lambda function: {function_name}")
+        logger.info("Deploying Lambda function: %s", function_name)
+
+        if architectures is None:
+            architectures = ['x86_64']
+
+        # Fail on bad parameters before reading the package or calling AWS
+        self._validate_lambda_parameters(timeout, memory_size)
 
         try:
             # Validate package exists and is readable
             if not package_path.exists():
                 raise FileNotFoundError(f"Package not found: {package_path}")
 
-            # Read package with error handling
-            try:
-                with open(package_path, 'rb') as f:
-                    zip_content = f.read()
-            except IOError as e:
-                raise IOError(f"Failed to read package file: {e}")
-
             # Validate package size
-            package_size_mb = len(zip_content) / (1024 * 1024)
+            package_size_mb = package_path.stat().st_size / (1024 * 1024)
             if package_size_mb > 250:  # AWS Lambda deployment package limit
                 raise ValueError(f"Package size {package_size_mb:.2f}MB exceeds AWS limit of 250MB")
 
-            function_exists = self.resource_exists('get_function', FunctionName=function_name)
-
-            if function_exists:
-                return self._update_function(
-                    function_name, env_vars, timeout, memory_size, zip_content
-                )
-            else:
-                return self._create_function(
-                    function_name, role_arn, handler, runtime,
-                    timeout, memory_size, env_vars, zip_content
-                )
+            if s3_bucket and not s3_key and package_size_mb > S3_UPLOAD_THRESHOLD_MB:
+                s3_key = f"{function_name}/{package_path.name}"
+                S3Manager(self.region, self.dry_run).upload_file(package_path, s3_bucket, s3_key)
+
+            with contextlib.ExitStack() as stack:
+                if s3_bucket and s3_key:
+                    code = {'S3Bucket': s3_bucket, 'S3Key': s3_key}
+                else:
+                    # Map the package rather than read() it: botocore encodes straight from the page cache
+                    try:
+                        package_file = stack.enter_context(open(package_path, 'rb'))
+                        zip_content = stack.enter_context(
+                            mmap.mmap(package_file.fileno(), 0, access=mmap.ACCESS_READ))
+                    except (OSError, ValueError) as e:
+                        raise IOError(f"Failed to read package file: {e}")
+                    code = {'ZipFile': zip_content}
+
+                current = self._get_function(function_name)
+
+                if current or self.dry_run:
+                    return self._update_function(
+                        function_name, env_vars, timeout, memory_size, code,
+                        package_path, (current or {}).get('Configuration', {}), architectures
+                    )
+                else:
+                    return self._create_function(
+                        function_name, role_arn, handler, runtime,
+                        timeout, memory_size, env_vars, code, architectures
+                    )
 
         except Exception as e:
-            logger.error(f"❌ Lambda deployment failed for {function_name}: {e}")
+            logger.error("❌ Lambda deployment failed for %s: %s", function_name, e)
             raise
 
+    def get_source_hash(self, function_name: str) -> Optional[str]:
+        """Return the source hash tagged on the deployed function, None if missing"""
+        response = self._get_function(function_name)
+        if not response:
+            return None
+        return response.get('Tags', {}).get(SOURCE_HASH_TAG)
+
+    def _get_function(self, function_name: str) -> Optional[dict]:
+        """
+        get_function response, None if the function does not exist
+        Memoized so the source-hash check and the deploy share one call; changes invalidate it
+        """
+        try:
+            return self.cached_call('get_function', FunctionName=function_name)
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ResourceNotFoundException':
+                return None
+            raise
+
+    def set_source_hash(self, function_arn: str, source_hash: str) -> None:
+        """Tag the function with the hash of what was just deployed"""
+        self.safe_call('tag_resource', Resource=function_arn, Tags={SOURCE_HASH_TAG: source_hash})
+        self.invalidate_cache('get_function', FunctionName=function_arn.rsplit(':', 1)[-1])
+
     def _create_function(
             self,
             function_name: str,
@@ -79,31 +146,30 @@ class LambdaManager(AWSServiceManager):
             timeout: int,
             memory_size: int,
             env_vars: dict,
-            zip_content: bytes
+            code: dict,
+            architectures: List[str]
     ) -> str:
         """Create new Lambda function with validation"""
         logger.info("Creating new Lambda function...")
 
-        # Validate parameters
-        self._validate_lambda_parameters(timeout, memory_size)
-
-        response = self.safe_call_with_retry(
+        response = self._call_until_role_assumable(
             'create_function',
             FunctionName=function_name,
             Runtime=runtime,
             Role=role_arn,
             Handler=handler,
-            Code={'ZipFile': zip_content},
+            Code=code,
             Timeout=timeout,
             MemorySize=memory_size,
+            Architectures=architectures,
             Environment={'Variables': env_vars},
             Tags={
                 'Application': 'pnpgwatch',
                 'ManagedBy': 'deploy-script',
                 'BudgetEnforced': 'true'
-            },
-            max_attempts=3
+            }
         )
+        self.invalidate_cache('get_function', FunctionName=function_name)
 
         if self.dry_run:
             return f"arn:aws:lambda:{self.region}:000000000000:function:{function_name}"
@@ -111,7 +177,7 @@ class LambdaManager(AWSServiceManager):
         # Wait for function to be active
         self._wait_for_function_active(function_name)
 
-        logger.info(f"✅ Lambda function created: {function_name}")
+        logger.info("✅ Lambda function created: %s", function_name)
         return response['FunctionArn']
 
     def _update_function(
@@ -120,134 +186,165 @@ class LambdaManager(AWSServiceManager):
             env_vars: dict,
             timeout: int,
             memory_size: int,
-            zip_content: bytes
+            code: dict,
+            package_path: Path,
+            current_configuration: dict,
+            architectures: List[str]
     ) -> str:
         """Update existing Lambda function with rollback capability"""
         logger.info("Updating existing Lambda function...")
 
-        # Validate parameters
-        self._validate_lambda_parameters(timeout, memory_size)
-
         try:
-            # Update code
-            code_response = self.safe_call_with_retry(
-                'update_function_code',
-                FunctionName=function_name,
-                ZipFile=zip_content,
-                max_attempts=3
-            )
+            function_arn = current_configuration.get('FunctionArn')
+            updated = False
 
-            if not self.dry_run:
-                # Wait for code update to complete
+            # Lambda allows one update at a time per function: the code update has to finish
+            # (function_updated_v2) before the configuration update is accepted
+            if self._code_matches(current_configuration, package_path, architectures):
+                logger.info("✅ Code unchanged, skipping upload")
+            else:
+                code_response = self.safe_call(
+                    'update_function_code',
+                    FunctionName=function_name,
+                    Architectures=architectures,
+                    **code
+                )
+                updated = True
                 self._wait_for_function_updated(function_name)
+                if code_response:
+                    function_arn = code_response['FunctionArn']
 
-            # Update configuration
-            config_response = self.safe_call_with_retry(
-                'update_function_configuration',
-                FunctionName=function_name,
-                Environment={'Variables': env_vars},
-                Timeout=timeout,
-                MemorySize=memory_size,
-                max_attempts=3
-            )
+            if self._configuration_matches(current_configuration, env_vars, timeout, memory_size):
+                logger.info("✅ Configuration unchanged, skipping configuration update")
+            else:
+                self.safe_call(
+                    'update_function_configuration',
+                    FunctionName=function_name,
+                    Environment={'Variables': env_vars},
+                    Timeout=timeout,
+                    MemorySize=memory_size
+                )
+                updated = True
+                self._wait_for_function_updated(function_name)
+
+            if updated:
+                self.invalidate_cache('get_function', FunctionName=function_name)
 
             if self.dry_run:
                 return f"arn:aws:lambda:{self.region}:000000000000:function:{function_name}"
 
-            logger.info(f"✅ Lambda function updated: {function_name}")
-            return code_response['FunctionArn']
+            logger.info("✅ Lambda function updated: %s", function_name)
+            return function_arn
 
         except Exception as e:
-            logger.error(f"❌ Failed to update Lambda function {function_name}: {e}")
+            logger.error("❌ Failed to update Lambda function %s: %s", function_name, e)
             # TODO: Implement rollback to previous version
             raise
 
+    def _call_until_role_assumable(self, operation: str, max_role_attempts: int = 10, **kwargs) -> Any:
+        """
+        A freshly created role can exist in IAM before Lambda is able to assume it;
+        retry only that specific error instead of sleeping up front after every role creation
+        """
+        for attempt in range(max_role_attempts):
+            try:
+                return self.safe_call(operation, **kwargs)
+            except ClientError as e:
+                message = e.response['Error'].get('Message', '')
+                if 'cannot be assumed' not in message or attempt == max_role_attempts - 1:
+                    raise
+                logger.info("Waiting for IAM role to propagate to Lambda...")
+                time.sleep(min(2 ** attempt, 8))
+
+    @staticmethod
+    def _code_matches(current: dict, package_path: Path, architectures: List[str]) -> bool:
+        """True if the deployed code has the same CodeSha256 and architecture as the local package"""
+        deployed_sha = current.get('CodeSha256')
+        if not deployed_sha or current.get('Architectures', ['x86_64']) != architectures:
+            return False
+
+        local_sha = base64.b64encode(file_sha256(package_path).digest()).decode()
+        return local_sha == deployed_sha
+
+    @staticmethod
+    def _configuration_matches(current: Optional[dict], env_vars: dict, timeout: int, memory_size: int) -> bool:
+        """True if a function configuration already has these values (no update needed)"""
+        if not current:
+            return False
+
+        return (
+            current.get('Environment', {}).get('Variables', {}) == env_vars and
+            current.get('Timeout') == timeout and
+            current.get('MemorySize') == memory_size
+        )
+
     def _validate_lambda_parameters(self, timeout: int, memory_size: int) -> None:
         """Validate Lambda configuration parameters"""
-        if timeout < 1 or timeout > 900:
-            raise ValueError(f"Timeout {timeout} must be between 1 and 900 seconds")
+        if not MIN_TIMEOUT <= timeout <= MAX_TIMEOUT:
+            raise ValueError(f"Timeout {timeout} must be between {MIN_TIMEOUT} and {MAX_TIMEOUT} seconds")
 
-        if memory_size < 128 or memory_size > 10240:
-            raise ValueError(f"Memory size {memory_size} must be between 128 and 10240 MB")
+        if not MIN_MEMORY <= memory_size <= MAX_MEMORY:
+            raise ValueError(f"Memory size {memory_size} must be between {MIN_MEMORY} and {MAX_MEMORY} MB")
 
         # Check memory size increments
-        if memory_size % 64 != 0:
-            raise ValueError(f"Memory size {memory_size} must be a multiple of 64")
+        if memory_size % MEMORY_STEP:
+            raise ValueError(f"Memory size {memory_size} must be a multiple of {MEMORY_STEP}")
 
-    def _wait_for_function_active(self, function_name: str, max_attempts: int = 20) -> None:
-        """Wait for Lambda function to become active"""
+    def _wait_for_function_active(self, function_name: str, max_attempts: int = 40) -> None:
+        """Wait for Lambda function to become active (botocore waiter polling every second)"""
         if self.dry_run:
             return
 
-        logger.info(f"Waiting for function {function_name} to become active...")
+        logger.info("Waiting for function %s to become active...", function_name)
 
-        for attempt in range(max_attempts):
-            try:
-                response = self.safe_call('get_function', FunctionName=function_name)
-                state = response['Configuration']['State']
-
-                if state == 'Active':
-                    logger.info("✅ Function is active")
-                    return
-                elif state == 'Failed':
-                    raise ValueError(
-                        f"Function creation failed: {response['Configuration'].get('StateReason', 'Unknown error')}")
-                elif state == 'Pending':
-                    if attempt < max_attempts - 1:
-                        time.sleep(2)
-                    else:
-                        raise TimeoutError(f"Function did not become active within {max_attempts * 2} seconds")
-
-            except Exception as e:
-                if attempt == max_attempts - 1:
-                    raise TimeoutError(f"Failed to check function state: {e}")
-                time.sleep(2)
-
-    def _wait_for_function_updated(self, function_name: str, max_attempts: int = 20) -> None:
-        """Wait for Lambda function update to complete"""
+        try:
+            self.client.get_waiter('function_active_v2').wait(
+                FunctionName=function_name,
+                WaiterConfig={'Delay': 1, 'MaxAttempts': max_attempts}
+            )
+        except WaiterError as e:
+            configuration = (e.last_response or {}).get('Configuration', {})
+            if configuration.get('State') == 'Failed':
+                raise ValueError(
+                    f"Function creation failed: {configuration.get('StateReason', 'Unknown error')}")
+            raise TimeoutError(f"Function did not become active within {max_attempts} seconds: {e}")
+
+        logger.info("✅ Function is active")
+
+    def _wait_for_function_updated(self, function_name: str, max_attempts: int = 60) -> None:
+        """Wait for Lambda function update to complete (botocore waiter polling every second)"""
         if self.dry_run:
             return
 
-        logger.info(f"Waiting for function {function_name} update to complete...")
+        logger.info("Waiting for function %s update to complete...", function_name)
 
-        for attempt in range(max_attempts):
-            try:
-                response = self.safe_call('get_function', FunctionName=function_name)
-                last_update_status = response['Configuration']['LastUpdateStatus']
-
-                if last_update_status == 'Successful':
-                    logger.info("✅ Function update completed")
-                    return
-                elif last_update_status == 'Failed':
-                    raise ValueError(
-                        f"Function update failed: {response['Configuration'].get('LastUpdateStatusReason', 'Unknown error')}")
-                elif last_update_status in ['InProgress', '']:
-                    if attempt < max_attempts - 1:
-                        time.sleep(2)
-                    else:
-                        raise TimeoutError(f"Function update did not complete within {max_attempts * 2} seconds")
-
-            except Exception as e:
-                if attempt == max_attempts - 1:
-                    raise TimeoutError(f"Failed to check function update status: {e}")
-                time.sleep(2)
+        try:
+            self.client.get_waiter('function_updated_v2').wait(
+                FunctionName=function_name,
+                WaiterConfig={'Delay': 1, 'MaxAttempts': max_attempts}
+            )
+        except WaiterError as e:
+            configuration = (e.last_response or {}).get('Configuration', {})
+            if configuration.get('LastUpdateStatus') == 'Failed':
+                raise ValueError(
+                    f"Function update failed: {configuration.get('LastUpdateStatusReason', 'Unknown error')}")
+            raise TimeoutError(f"Function update did not complete within {max_attempts} seconds: {e}")
+
+        logger.info("✅ Function update completed")
 
     def test_function(self, function_name: str, payload: dict = None) -> bool:
         """Test Lambda function invocation with comprehensive error handling"""
-        logger.info(f"Testing Lambda function: {function_name}")
+        logger.info("Testing Lambda function: %s", function_name)
 
         if payload is None:
             payload = {"test": "deployment_test", "source": "deployer"}
 
         try:
-            import json
-
-            response = self.safe_call_with_retry(
+            response = self.safe_call(
                 'invoke',
                 FunctionName=function_name,
                 InvocationType='RequestResponse',
-                Payload=json.dumps(payload).encode(),
-                max_attempts=2
+                Payload=json.dumps(payload).encode()
             )
 
             if self.dry_run:
@@ -258,15 +355,15 @@ class LambdaManager(AWSServiceManager):
             if status_code == 200:
                 # Check function error
                 if 'FunctionError' in response:
-                    logger.error(f"❌ Lambda test failed with function error: {response.get('FunctionError')}")
+                    logger.error("❌ Lambda test failed with function error: %s", response.get('FunctionError'))
                     return False
 
                 logger.info("✅ Lambda test successful")
                 return True
             else:
-                logger.error(f"❌ Lambda test failed with status: {status_code}")
+                logger.error("❌ Lambda test failed with status: %s", status_code)
                 return False
 
         except Exception as e:
-            logger.error(f"❌ Lambda test failed: {e}")
+            logger.error("❌ Lambda test failed: %s", e)
             return False
\ No newline at end of file
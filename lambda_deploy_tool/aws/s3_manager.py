@@ -0,0 +1,138 @@
+# lambda_deploy_tool/aws/s3_manager.py
+"""
+S3 Artifact Manager
+Single Responsibility: Upload deployment artifacts to S3
+"""
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import List
+
+from boto3.s3.transfer import TransferConfig
+
+from . import AWSServiceManager
+
+logger = logging.getLogger(__name__)
+
+# S3 requires every part except the last to be at least 5 MB
+PART_SIZE = 8 * 1024 * 1024
+MAX_UPLOAD_WORKERS = 10
+
+TRANSFER_CONFIG = TransferConfig(multipart_threshold=PART_SIZE, multipart_chunksize=PART_SIZE, max_concurrency=8)
+
+
+class S3Manager(AWSServiceManager):
+    """Manages deployment artifacts in S3 (SRP)"""
+
+    @property
+    def service_name(self) -> str:
+        return 's3'
+
+    def multipart_writer(self, bucket: str, key: str) -> 'MultipartUploadWriter':
+        """Start a multipart upload and return a file-like writer feeding it"""
+        response = self.safe_call('create_multipart_upload', Bucket=bucket, Key=key)
+        logger.info("☁️  Streaming package to s3://%s/%s", bucket, key)
+        return MultipartUploadWriter(self, bucket, key, response['UploadId'])
+
+    def upload_file(self, path: Path, bucket: str, key: str) -> None:
+        """Upload a finished file with concurrent multipart transfer"""
+        if self.dry_run:
+            logger.info("[DRY-RUN] Would upload %s to s3://%s/%s", path, bucket, key)
+            return
+
+        logger.info("☁️  Uploading %s to s3://%s/%s", path.name, bucket, key)
+        self.client.upload_file(str(path), bucket, key, Config=TRANSFER_CONFIG)
+
+
+class MultipartUploadWriter:
+    """
+    Write-only stream that uploads every PART_SIZE bytes as an S3 part on a thread pool,
+    so the upload runs while the data is still being produced
+    """
+
+    def __init__(self, manager: S3Manager, bucket: str, key: str, upload_id: str):
+        self.manager = manager
+        self.bucket = bucket
+        self.key = key
+        self.upload_id = upload_id
+        self._buffer = bytearray()
+        self._parts: List[Future] = []
+        self._executor = ThreadPoolExecutor(max_workers=MAX_UPLOAD_WORKERS)
+        # Bound the parts held in memory when the network is slower than the producer
+        self._in_flight = threading.BoundedSemaphore(MAX_UPLOAD_WORKERS * 2)
+        self._cancelled = threading.Event()
+        self._finished = False
+
+    def write(self, data: bytes) -> int:
+        self._check_cancelled()
+        self._buffer += data
+        while len(self._buffer) >= PART_SIZE:
+            self._submit_part(bytes(self._buffer[:PART_SIZE]))
+            del self._buffer[:PART_SIZE]
+        return len(data)
+
+    def close(self) -> None:
+        """Upload the remaining bytes and complete the multipart upload"""
+        try:
+            self._check_cancelled()
+            if self._buffer or not self._parts:
+                self._submit_part(bytes(self._buffer))
+                self._buffer.clear()
+
+            parts = [future.result() for future in self._parts]
+            self.manager.safe_call(
+                'complete_multipart_upload',
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                MultipartUpload={'Parts': parts}
+            )
+            logger.info("✅ Uploaded package in %s parts to s3://%s/%s", len(parts), self.bucket, self.key)
+            self._finished = True
+        except Exception:
+            self.abort()
+            raise
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def cancel(self) -> None:
+        """
+        Ask the producer to stop: its next write fails and it aborts the upload from its own
+        thread (aborting from here could strand it waiting for a cancelled part's slot)
+        """
+        self._cancelled.set()
+
+    def abort(self) -> None:
+        """Abort the multipart upload so no orphaned parts are billed; no-op once finished"""
+        if self._finished:
+            return
+        self._finished = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        try:
+            self.manager.safe_call('abort_multipart_upload', Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+        except Exception as e:
+            logger.warning("⚠️  Failed to abort multipart upload %s: %s", self.upload_id, e)
+
+    def _check_cancelled(self) -> None:
+        if self._cancelled.is_set():
+            raise RuntimeError(f"Upload to s3://{self.bucket}/{self.key} was cancelled")
+
+    def _submit_part(self, body: bytes) -> None:
+        self._in_flight.acquire()
+        part_number = len(self._parts) + 1
+        self._parts.append(self._executor.submit(self._upload_part, part_number, body))
+
+    def _upload_part(self, part_number: int, body: bytes) -> dict:
+        try:
+            response = self.manager.safe_call(
+                'upload_part',
+                Bucket=self.bucket,
+                Key=self.key,
+                UploadId=self.upload_id,
+                PartNumber=part_number,
+                Body=body
+            )
+            return {'PartNumber': part_number, 'ETag': response['ETag']}
+        finally:
+            self._in_flight.release()
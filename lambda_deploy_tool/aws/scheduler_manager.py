@@ -37,60 +37,25 @@ class SchedulerManager(AWSServiceManager):
                               Only valid for cron expressions, ignored for rate expressions
             description: Optional description for the schedule
         """
-        logger.info(f"Setting up EventBridge schedule: {schedule_name}")
-        logger.info(f"  Expression: {schedule_expression}")
+        logger.info("Setting up EventBridge schedule: %s", schedule_name)
+        logger.info("  Expression: %s", schedule_expression)
         if schedule_timezone:
-            logger.info(f"  Timezone: {schedule_timezone}")
+            logger.info("  Timezone: %s", schedule_timezone)
 
         schedule_exists = self._schedule_exists(schedule_name)
 
-        target_config = {
-            'Arn': target_arn,
-            'RoleArn': role_arn
-        }
-
-        flexible_time_window = {
-            'Mode': 'FLEXIBLE',
-            'MaximumWindowInMinutes': 5
-        }
-
-        if schedule_exists:
-            self._update_schedule(
-                schedule_name, schedule_expression, target_config,
-                flexible_time_window, schedule_timezone, description
-            )
-        else:
-            self._create_schedule(
-                schedule_name, schedule_expression, target_config,
-                flexible_time_window, schedule_timezone, description
-            )
-
-    def _schedule_exists(self, schedule_name: str) -> bool:
-        """Check if schedule exists"""
-        try:
-            self.safe_call('get_schedule', Name=schedule_name)
-            return True
-        except Exception:
-            return False
-
-    def _create_schedule(
-            self,
-            schedule_name: str,
-            schedule_expression: str,
-            target: dict,
-            flexible_time_window: dict,
-            schedule_timezone: str = None,
-            description: str = None
-    ) -> None:
-        """Create new schedule"""
-        logger.info("Creating new schedule...")
-
-        # Build parameters
+        # Create and update take identical parameters, so build them (and classify the expression) once
         params = {
             'Name': schedule_name,
             'ScheduleExpression': schedule_expression,
-            'Target': target,
-            'FlexibleTimeWindow': flexible_time_window
+            'Target': {
+                'Arn': target_arn,
+                'RoleArn': role_arn
+            },
+            'FlexibleTimeWindow': {
+                'Mode': 'FLEXIBLE',
+                'MaximumWindowInMinutes': 5
+            }
         }
 
         # Add description if provided
@@ -100,41 +65,29 @@ class SchedulerManager(AWSServiceManager):
         # Add timezone if provided and expression is cron
         if schedule_timezone and schedule_expression.startswith('cron('):
             params['ScheduleExpressionTimezone'] = schedule_timezone
-            logger.info(f"  Using timezone: {schedule_timezone}")
+            logger.info("  Using timezone: %s", schedule_timezone)
 
-        self.safe_call('create_schedule', **params)
+        if schedule_exists:
+            self._update_schedule(params)
+        else:
+            self._create_schedule(params)
 
-        logger.info(f"✅ Schedule created: {schedule_name}")
+    def _schedule_exists(self, schedule_name: str) -> bool:
+        """Check if schedule exists"""
+        return self.resource_exists('get_schedule', Name=schedule_name)
 
-    def _update_schedule(
-            self,
-            schedule_name: str,
-            schedule_expression: str,
-            target: dict,
-            flexible_time_window: dict,
-            schedule_timezone: str = None,
-            description: str = None
-    ) -> None:
-        """Update existing schedule"""
-        logger.info("Updating existing schedule...")
+    def _create_schedule(self, params: dict) -> None:
+        """Create new schedule"""
+        logger.info("Creating new schedule...")
 
-        # Build parameters
-        params = {
-            'Name': schedule_name,
-            'ScheduleExpression': schedule_expression,
-            'Target': target,
-            'FlexibleTimeWindow': flexible_time_window
-        }
+        self.safe_call('create_schedule', **params)
 
-        # Add description if provided
-        if description:
-            params['Description'] = description
+        logger.info("✅ Schedule created: %s", params['Name'])
 
-        # Add timezone if provided and expression is cron
-        if schedule_timezone and schedule_expression.startswith('cron('):
-            params['ScheduleExpressionTimezone'] = schedule_timezone
-            logger.info(f"  Using timezone: {schedule_timezone}")
+    def _update_schedule(self, params: dict) -> None:
+        """Update existing schedule"""
+        logger.info("Updating existing schedule...")
 
         self.safe_call('update_schedule', **params)
 
-        logger.info(f"✅ Schedule updated: {schedule_name}")
\ No newline at end of file
+        logger.info("✅ Schedule updated: %s", params['Name'])
@@ -3,6 +3,7 @@
 Container Builder for Lambda
 """
 import logging
+import os
 import subprocess
 import tempfile
 import json
@@ -10,6 +11,9 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Lines of docker output shown when a quiet build or push fails
+FAILURE_OUTPUT_LINES = 50
+
 
 class ContainerBuilder:
     """Builds Docker images for Lambda container deployment"""
@@ -35,8 +39,10 @@ class ContainerBuilder:
             if not build_success:
                 return False
 
-            # Step 3: Push to ECR (unless disabled or dry-run)
-            if not self.config.dry_run and not getattr(self.config, 'no_push', False):
+            # Step 3: Push to ECR (unless disabled, dry-run, or already pushed by the build)
+            if not self.config.dry_run and not self.config.no_push:
+                if self._push_from_build():
+                    return True
                 push_success = self._docker_push()
                 return push_success
 
@@ -91,14 +97,21 @@ class ContainerBuilder:
             return True
 
         # Build command
+        push_from_build = self._push_from_build()
         cmd = [
-            'docker', 'build',
-            '--no-cache',
+            'docker', *(('buildx', 'build') if push_from_build else ('build',)),
+            '--progress=plain',
             '-t', self.config.ecr_repository_uri,
             '-f', str(self.config.dockerfile_path),
             str(self.config.docker_context)
         ]
 
+        if self.config.docker_no_cache:
+            cmd.append('--no-cache')
+        else:
+            # Embed layer cache metadata in the pushed image so the next build can reuse it
+            cmd.extend(['--build-arg', 'BUILDKIT_INLINE_CACHE=1'])
+
         # Add build args
         for key, value in self.config.get_build_args().items():
             cmd.extend(['--build-arg', f'{key}={value}'])
@@ -107,40 +120,43 @@ class ContainerBuilder:
         if self.config.platform:
             cmd.extend(['--platform', self.config.platform])
 
-        # Add cache from
-        for cache in self.config.cache_from:
+        # Add cache from (default: the previously pushed image and its inline cache)
+        cache_from = self.config.cache_from
+        if not cache_from and not self.config.docker_no_cache:
+            cache_from = [self.config.ecr_repository_uri]
+        for cache in cache_from:
             cmd.extend(['--cache-from', cache])
 
-        try:
-            # Run build with real-time output
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-
-            # Stream output
-            for line in process.stdout:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    logger.info(f"  {line}")
+        if push_from_build:
+            # docker push always sends gzip layers; the image exporter can write zstd ones instead
+            cmd.extend(['--output', ','.join([
+                'type=image',
+                f'name={self.config.ecr_repository_uri}',
+                'push=true',
+                'oci-mediatypes=true',
+                f'compression={self.config.layer_compression}',
+                f'compression-level={self.config.layer_compression_level}',
+                'force-compression=true',
+            ])])
 
-            process.wait()
+        try:
+            returncode = self._run_docker(cmd)
 
-            if process.returncode == 0:
+            if returncode == 0:
                 logger.info(f"✅ Docker image built: {self.config.ecr_repository_uri}")
                 return True
             else:
-                logger.error(f"❌ Docker build failed with code {process.returncode}")
+                logger.error(f"❌ Docker build failed with code {returncode}")
                 return False
 
         except Exception as e:
             logger.error(f"❌ Docker build failed: {e}")
             return False
 
+    def _push_from_build(self) -> bool:
+        """True if BuildKit pushes the image itself (needed for non-gzip layer compression)"""
+        return bool(self.config.layer_compression) and not self.config.no_push
+
     def _docker_push(self) -> bool:
         """Push Docker image to ECR"""
         logger.info(f"📤 Pushing image to ECR: {self.config.ecr_repository_uri}")
@@ -152,37 +168,45 @@ class ContainerBuilder:
         cmd = ['docker', 'push', self.config.ecr_repository_uri]
 
         try:
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
+            returncode = self._run_docker(cmd)
 
-            # Stream output
-            for line in process.stdout:
-                line = line.strip()
-                if line:
-                    logger.info(f"  {line}")
-
-            process.wait()
-
-            if process.returncode == 0:
+            if returncode == 0:
                 logger.info(f"✅ Docker image pushed to ECR")
                 return True
             else:
-                logger.error(f"❌ Docker push failed with code {process.returncode}")
+                logger.error(f"❌ Docker push failed with code {returncode}")
                 return False
 
         except Exception as e:
             logger.error(f"❌ Docker push failed: {e}")
             return False
 
+    @staticmethod
+    def _run_docker(cmd: list) -> int:
+        """
+        Run a docker command with BuildKit enabled, returns its exit code
+        Output is streamed line by line only with debug logging; otherwise it is
+        collected in one go and just the tail is shown if the command fails
+        """
+        env = {**os.environ, 'DOCKER_BUILDKIT': '1'}
+
+        if logger.isEnabledFor(logging.DEBUG):
+            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
+            for line in process.stdout:
+                line = line.strip()
+                if line:
+                    logger.debug("  %s", line)
+            return process.wait()
+
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, env=env)
+        if result.returncode != 0:
+            for line in result.stdout.splitlines()[-FAILURE_OUTPUT_LINES:]:
+                logger.error("  %s", line)
+        return result.returncode
+
     def test_locally(self, event: dict = None) -> bool:
         """Test container locally"""
-        if not getattr(self.config, 'local_test_enabled', False):
+        if not self.config.local_test_enabled:
             return True
 
         logger.info("🧪 Testing container locally...")
@@ -193,7 +217,7 @@ class ContainerBuilder:
             return True
 
         if event is None:
-            event = getattr(self.config, 'local_test_event', {"test": "local"})
+            event = self.config.local_test_event
 
         # Create temporary event file
         with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
@@ -0,0 +1,46 @@
+# lambda_deploy_tool/cache.py
+"""
+Small persistent cache shared between deploy runs
+"""
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def user_cache_dir() -> Path:
+    """Per-user cache directory (honours XDG_CACHE_HOME, LOCALAPPDATA on Windows)"""
+    if sys.platform == 'win32':
+        base = Path(os.environ.get('LOCALAPPDATA', Path.home() / 'AppData' / 'Local'))
+    else:
+        base = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+    return base / 'lambda-deploy-tool'
+
+
+def load_json(name: str) -> dict:
+    """Load a cached JSON document, empty dict if missing or unreadable"""
+    path = user_cache_dir() / name
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable cache file {path}: {e}")
+        return {}
+
+
+def save_json(name: str, data: dict) -> None:
+    """Atomically replace a cached JSON document; failures only cost a cache miss"""
+    path = user_cache_dir() / name
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug(f"Could not write cache file {path}: {e}")
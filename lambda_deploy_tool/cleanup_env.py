@@ -2,18 +2,40 @@
 """
 Utility to clean up Lambda environment variables
 """
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 logger = logging.getLogger(__name__)
 
+# Concurrent cleanups are bounded by the client's connection pool
+MAX_CLEANUP_WORKERS = 10
+
+
+@functools.lru_cache(maxsize=None)
+def _lambda_client(region: str):
+    """One Lambda client per region, reused across cleanup calls (self-contained so the script runs standalone)"""
+    return boto3.client(
+        'lambda',
+        region_name=region,
+        config=Config(
+            tcp_keepalive=True,
+            max_pool_connections=MAX_CLEANUP_WORKERS,
+            retries={'mode': 'adaptive', 'max_attempts': 3}
+        )
+    )
+
 
 def cleanup_lambda_environment(function_name: str, region: str = 'ap-southeast-1'):
     """
     Clean up Lambda function environment variables by setting only required ones
     """
-    lambda_client = boto3.client('lambda', region_name=region)
+    lambda_client = _lambda_client(region)
 
     try:
         # Get current function configuration
@@ -42,14 +64,33 @@ def cleanup_lambda_environment(function_name: str, region: str = 'ap-southeast-1
         raise
 
 
+def cleanup_lambda_environments(function_names: Iterable[str], region: str = 'ap-southeast-1'):
+    """
+    Clean up several functions concurrently (boto3 clients are thread-safe, so one shared
+    client serves every worker); total time is about one round trip instead of one per function
+    """
+    function_names = list(dict.fromkeys(function_names))
+    if not function_names:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CLEANUP_WORKERS, len(function_names))) as executor:
+        futures = [executor.submit(cleanup_lambda_environment, name, region) for name in function_names]
+        # Let every cleanup finish before surfacing the first failure
+        errors = [future.exception() for future in futures]
+
+    for error in errors:
+        if error is not None:
+            raise error
+
+
 if __name__ == '__main__':
     import argparse
 
     parser = argparse.ArgumentParser(description='Clean up Lambda environment variables')
-    parser.add_argument('--function-name', required=True, help='Lambda function name')
+    parser.add_argument('--function-name', required=True, nargs='+', help='Lambda function name(s)')
     parser.add_argument('--region', default='ap-southeast-1', help='AWS region')
 
     args = parser.parse_args()
 
     logging.basicConfig(level=logging.INFO)
-    cleanup_lambda_environment(args.function_name, args.region)
\ No newline at end of file
+    cleanup_lambda_environments(args.function_name, args.region)
\ No newline at end of file
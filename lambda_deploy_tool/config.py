@@ -2,25 +2,53 @@
 """
 Generic deployment configuration management
 """
+import functools
+import logging
 import os
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Set
+from typing import Callable, ClassVar, Optional, Dict, List, Set, Tuple
 
-try:
-    from dotenv import load_dotenv
-except ImportError:
-    load_dotenv = None
+logger = logging.getLogger(__name__)
 
+# Slotted instances (Python 3.10+): no per-instance __dict__, faster attribute access
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+# .env files already applied to os.environ in this process (resolved path -> mtime_ns loaded)
+_DOTENV_LOADED: Dict[Path, int] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_load_dotenv() -> Optional[Callable]:
+    """python-dotenv's load_dotenv, imported only once a .env file actually has to be read"""
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return None
+    return load_dotenv
+
+
+# Configs are never compared, and a 40-field repr is useless in logs
+@dataclass(eq=False, repr=False, **_DATACLASS_SLOTS)
 class DeployConfig:
     """Generic deployment configuration"""
 
+    # Subclasses that deploy something other than a zip (container images) set this to False
+    builds_zip_package: ClassVar[bool] = True
+
     # Build configuration
     source_dir: Path = Path('.')
+    source_files: List[str] = field(default_factory=list)  # Package exactly these (relative to source_dir), no scan
     output_dir: Path = Path('dist')
     package_name: str = 'lambda-package.zip'
+    compression_level: int = 1  # zlib level 1-9, 0 stores files uncompressed
+    wheelhouse_dir: Optional[Path] = None  # Local wheels for offline/fast installs (pip --find-links)
+    artifact_bucket: Optional[str] = None  # Ship the package through this S3 bucket instead of inline bytes
+    strict_binary: bool = False  # Only accept wheels matching the Lambda runtime, never build sdists
+    prune_dependencies: bool = True  # Drop __pycache__, tests, .pyi stubs and RECORD files from dependencies
+    strip_binaries: bool = False  # Run strip --strip-unneeded on compiled extensions (needs binutils for the target arch)
+    parallel_pip_workers: int = 1  # >1 splits requirements across concurrent pip processes (uv is used instead if found)
 
     # AWS configuration
     region: str = 'us-east-1'
@@ -33,9 +61,12 @@ class DeployConfig:
     timeout: int = 300
     memory_size: int = 512
     handler: str = 'lambda_function.lambda_handler'
+    architectures: List[str] = field(default_factory=lambda: ['x86_64'])  # ['arm64'] for Graviton
 
     # Schedule configuration
     schedule_expression: str = 'rate(5 minutes)'
+    schedule_timezone: Optional[str] = None  # Only applies to cron() expressions
+    schedule_description: Optional[str] = None  # Defaults to '<function_name> execution schedule'
 
     # Budget configuration
     enable_budget: bool = True
@@ -53,6 +84,8 @@ class DeployConfig:
 
     # Execution options
     dry_run: bool = False
+    concurrent: bool = False  # Run deployment steps as a dependency graph (budget, build, IAM, ECR in parallel)
+    force_deploy: bool = False  # Redeploy even if package and configuration are unchanged
 
     # Environment variable configuration
     required_env_vars: Set[str] = field(default_factory=set)
@@ -61,16 +94,23 @@ class DeployConfig:
 
     # Derived properties
     account_id: Optional[str] = field(default=None, init=False)
-    package_path: Path = field(init=False)
+    package_path: Optional[Path] = field(init=False)
+    # (filtered variables, their size in bytes) from the last get_env_vars call
+    _env_cache: Optional[Tuple[Dict[str, str], int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         """Initialize derived properties"""
-        self.package_path = self.output_dir / self.package_name
+        self.package_path = self.output_dir / self.package_name if self.builds_zip_package else None
 
         # Set default budget topic name if not provided
         if not self.budget_topic_name and self.function_name:
             self.budget_topic_name = f"{self.function_name}-budget-alerts"
 
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(function_name={self.function_name!r}, region={self.region!r})"
+
     @property
     def lambda_arn(self) -> str:
         """Get Lambda function ARN"""
@@ -85,44 +125,95 @@ class DeployConfig:
             raise ValueError("Account ID not set")
         return f"arn:aws:iam::{self.account_id}:role/{self.role_name}"
 
+    @property
+    def scheduler_role_name(self) -> str:
+        """Name of the role EventBridge Scheduler assumes to invoke the function"""
+        return f'{self.function_name}-schedule-role'
+
+    @property
+    def scheduler_role_arn(self) -> str:
+        """Get EventBridge Scheduler role ARN"""
+        if not self.account_id:
+            raise ValueError("Account ID not set")
+        return f"arn:aws:iam::{self.account_id}:role/{self.scheduler_role_name}"
+
+    def bind_account(self, account_id: str) -> None:
+        """Set the account once it is known"""
+        self.account_id = account_id
+
     def get_env_vars(self) -> Dict[str, str]:
         """
         Get filtered environment variables for Lambda
         Extend this in subclasses for specific filtering
         """
-        env_vars = {}
-
         # Determine which .env file to load
         env_file = self._get_env_file_path()
+        try:
+            env_mtime = env_file.stat().st_mtime_ns
+        except OSError:
+            env_mtime = None
+        load_dotenv = _get_load_dotenv() if env_mtime is not None else None
+        if load_dotenv is None:
+            env_mtime = None
+
+        env_vars = {}
 
-        # Load .env file if available
-        if load_dotenv and env_file.exists():
-            load_dotenv(env_file, override=True)
-            self._log_env_loaded(env_file)
+        # Load .env file if available; every config in the process shares one parse per version.
+        # The process environment itself is read on every call, so changes to it are picked up
+        if env_mtime is not None:
+            env_key = env_file.resolve()
+            if _DOTENV_LOADED.get(env_key) != env_mtime:
+                load_dotenv(env_file, override=True)
+                _DOTENV_LOADED[env_key] = env_mtime
+                self._log_env_loaded(env_file)
         elif not self.local_test_enabled and not self.dry_run:
             # Only require .env for real deployments
             raise FileNotFoundError(f".env file not found at {env_file}")
 
+        environ = os.environ
+
         # Add required environment variables
         for var_name in self.required_env_vars:
-            value = os.getenv(var_name)
+            value = environ.get(var_name)
             if value:
                 env_vars[var_name] = value
             elif not self.local_test_enabled:
                 # Only enforce required vars for real deployments
                 raise ValueError(f"Required environment variable not found: {var_name}")
 
-        # Add variables with allowed prefixes
-        for env_var, value in os.environ.items():
-            for prefix in self.allowed_env_prefixes:
-                if env_var.startswith(prefix) and value.strip():
-                    env_vars[env_var] = value.strip()
-                    break
+        # Add variables with allowed prefixes (str.startswith takes the whole tuple at once)
+        prefixes = tuple(self.allowed_env_prefixes)
+        if prefixes and os.supports_bytes_environ:
+            # os.environ decodes every key it iterates; match on the raw bytes, decode the hits only
+            byte_prefixes = tuple(os.fsencode(prefix) for prefix in prefixes)
+            for env_var, value in os.environb.items():
+                if env_var.startswith(byte_prefixes):
+                    value = os.fsdecode(value).strip()
+                    if value:
+                        env_vars[os.fsdecode(env_var)] = value
+        elif prefixes:
+            for env_var, value in environ.items():
+                if env_var.startswith(prefixes):
+                    value = value.strip()
+                    if value:
+                        env_vars[env_var] = value
+
+        # Every build step asks for the same variables; only log the summary when they changed
+        if self._env_cache is not None and self._env_cache[0] == env_vars:
+            return dict(env_vars)
+
+        total_size = sum(len(k) + len(v) for k, v in env_vars.items())
+        self._log_env_summary(env_vars, total_size)
 
-        # Log summary
-        self._log_env_summary(env_vars)
+        self._env_cache = (env_vars, total_size)
+        return dict(env_vars)
 
-        return env_vars
+    def env_vars_size(self, env_vars: Dict[str, str]) -> int:
+        """Key + value length of env_vars, reusing the size computed by get_env_vars when unchanged"""
+        # A C-level dict comparison is much cheaper than re-summing every length in Python
+        if self._env_cache is not None and self._env_cache[0] == env_vars:
+            return self._env_cache[1]
+        return sum(len(k) + len(v) for k, v in env_vars.items())
 
     def _get_env_file_path(self) -> Path:
         """Get the path to the .env file"""
@@ -132,16 +223,10 @@ class DeployConfig:
 
     def _log_env_loaded(self, env_file: Path) -> None:
         """Log that environment file was loaded"""
-        import logging
-        logger = logging.getLogger(__name__)
         logger.info(f"✅ Loaded environment from {env_file}")
 
-    def _log_env_summary(self, env_vars: Dict[str, str]) -> None:
+    def _log_env_summary(self, env_vars: Dict[str, str], total_size: int) -> None:
         """Log environment variable summary"""
-        import logging
-        logger = logging.getLogger(__name__)
-
-        total_size = sum(len(k) + len(v) for k, v in env_vars.items())
         logger.info(f"📋 Environment variables: {len(env_vars)} variables, ~{total_size} bytes")
 
         # Warn if approaching Lambda limit
@@ -150,11 +235,10 @@ class DeployConfig:
         else:
             logger.info(f"✅ Environment variables within safe limits ({total_size}/4096 bytes)")
 
-    def validate_env_vars_size(self, env_vars: Dict[str, str]) -> bool:
+    def validate_env_vars_size(self, env_vars: Dict[str, str], total_size: Optional[int] = None) -> bool:
         """Validate that environment variables don't exceed Lambda limits"""
-        total_size = 0
-        for key, value in env_vars.items():
-            total_size += len(key) + len(value)
+        if total_size is None:
+            total_size = self.env_vars_size(env_vars)
 
         # Add overhead for JSON structure and AWS encoding
         estimated_size = total_size + (len(env_vars) * 10) + 100
@@ -4,15 +4,18 @@ Container-specific configuration extending generic DeployConfig
 """
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import ClassVar, Optional, Dict, List
 
-from .config import DeployConfig
+from .config import DeployConfig, _DATACLASS_SLOTS
 
 
-@dataclass
+@dataclass(eq=False, repr=False, **_DATACLASS_SLOTS)
 class ContainerDeployConfig(DeployConfig):
     """Configuration for container-based Lambda deployment"""
 
+    # No zip package for container deployments: package_path stays None
+    builds_zip_package: ClassVar[bool] = False
+
     # Container registry configuration
     ecr_repository_name: str = 'lambda-container'
     ecr_repository_uri: Optional[str] = None
@@ -26,14 +29,18 @@ class ContainerDeployConfig(DeployConfig):
 
     # Container-specific Lambda settings
     package_type: str = 'Image'
-    architectures: List[str] = field(default_factory=lambda: ['x86_64'])
 
     # Container environment
     container_env_vars: Dict[str, str] = field(default_factory=dict)
 
     # Build options
     build_args: Dict[str, str] = field(default_factory=dict)
-    cache_from: List[str] = field(default_factory=list)
+    cache_from: List[str] = field(default_factory=list)  # Defaults to the ECR image itself (inline cache)
+    docker_no_cache: bool = False  # Rebuild every layer instead of reusing the layer cache
+    layer_compression: Optional[str] = None  # e.g. 'zstd': BuildKit recompresses and pushes the layers itself
+    layer_compression_level: int = 3
+    no_push: bool = False  # --no-push
+    skip_container_test: bool = False  # --skip-container-test
 
     # Runtime options
     entrypoint: List[str] = field(default_factory=list)
@@ -41,7 +48,8 @@ class ContainerDeployConfig(DeployConfig):
 
     def __post_init__(self):
         """Initialize container-specific properties"""
-        super().__post_init__()
+        # Explicit base call: zero-argument super() breaks on slotted dataclasses before Python 3.14
+        DeployConfig.__post_init__(self)
 
         # Set package_type to Image for container deployment
         self.package_type = 'Image'
@@ -50,14 +58,17 @@ class ContainerDeployConfig(DeployConfig):
         if not self.ecr_repository_uri and self.account_id:
             self.ecr_repository_uri = f"{self.account_id}.dkr.ecr.{self.region}.amazonaws.com/{self.ecr_repository_name}"
 
-        # No zip package for container deployments
-        self.package_path = None
-
         # Set default entrypoint if not specified
         if not self.entrypoint and not self.command:
             # Default to Lambda Runtime Interface Emulator (RIE) if no custom entrypoint
             pass
 
+    def bind_account(self, account_id: str) -> None:
+        """Also derive the default ECR repository URI, as __post_init__ does for a known account"""
+        DeployConfig.bind_account(self, account_id)
+        if not self.ecr_repository_uri:
+            self.ecr_repository_uri = f"{account_id}.dkr.ecr.{self.region}.amazonaws.com/{self.ecr_repository_name}"
+
     @property
     def full_image_uri(self) -> str:
         """Get full ECR image URI"""
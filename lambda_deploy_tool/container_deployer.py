@@ -3,7 +3,7 @@
 Container Deployer
 """
 import logging
-from typing import List, Tuple, Callable
+from typing import List, Optional, Tuple, Callable
 
 from .deployer import Deployer
 from .config_container import ContainerDeployConfig
@@ -13,10 +13,44 @@ from .aws.lambda_container_manager import ContainerLambdaManager
 
 logger = logging.getLogger(__name__)
 
+# Invariant parts of the ECR pull policy; only the repository ARN varies per deployment
+_ECR_PULL_ACTIONS = (
+    "ecr:GetDownloadUrlForLayer",
+    "ecr:BatchGetImage",
+    "ecr:BatchCheckLayerAvailability"
+)
+_ECR_AUTH_STATEMENT = {
+    "Effect": "Allow",
+    "Action": "ecr:GetAuthorizationToken",
+    "Resource": "*"
+}
+
 
 class ContainerDeployer(Deployer):
     """Deployer for container-based Lambda functions"""
 
+    STEP_DEPENDENCIES = {
+        **Deployer.STEP_DEPENDENCIES,
+        "ECR Repository Setup": frozenset(),
+        "Container Build": frozenset({"ECR Repository Setup"}),
+        "Local Container Test": frozenset({"Container Build"}),
+        "Container Deployment": frozenset({"Container Build", "IAM Setup", "Local Container Test"}),
+        "Schedule Setup": frozenset({"Container Deployment"}),
+    }
+
+    # (label, method name, condition on config) in execution order; resolved per deployment
+    _STEP_SPECS: Tuple[Tuple[str, str, Optional[Callable[[ContainerDeployConfig], bool]]], ...] = (
+        ("ECR Repository Setup", "_setup_ecr_repository", None),
+        # Inherited, but skipped for local tests
+        ("Budget Setup", "_setup_budget_if_needed", lambda c: c.enable_budget and not c.local_test_enabled),
+        ("Container Build", "_build_container", None),
+        ("Local Container Test", "_test_container_locally",
+         lambda c: c.local_test_enabled and not c.skip_container_test),
+        ("IAM Setup", "_setup_iam_roles", lambda c: not c.local_test_enabled),
+        ("Container Deployment", "_deploy_container", lambda c: not c.local_test_enabled),
+        ("Schedule Setup", "_setup_schedule", lambda c: not c.local_test_enabled),
+    )
+
     def __init__(self, config: ContainerDeployConfig):
         # Initialize parent with config
         super().__init__(config)
@@ -37,34 +71,13 @@ class ContainerDeployer(Deployer):
             config.dry_run
         )
 
-        # Set container-specific deployment steps
-        self.deployment_steps = self.get_default_deployment_steps()
-
     def get_default_deployment_steps(self) -> List[Tuple[str, Callable]]:
         """Get container-specific deployment steps"""
-        steps = []
-
-        # ECR setup (container-specific)
-        steps.append(("ECR Repository Setup", self._setup_ecr_repository))
-
-        # Budget setup (inherited, but skip for local test)
-        if self.config.enable_budget and not self.config.local_test_enabled:
-            steps.append(("Budget Setup", self._setup_budget_if_needed))
-
-        # Container build (container-specific)
-        steps.append(("Container Build", self._build_container))
-
-        # Local test (container-specific, if enabled)
-        if self.config.local_test_enabled and not getattr(self.config, 'skip_container_test', False):
-            steps.append(("Local Container Test", self._test_container_locally))
-
-        # IAM setup (inherited, but skip for local test)
-        if not self.config.local_test_enabled:
-            steps.append(("IAM Setup", self._setup_iam_roles))
-            steps.append(("Container Deployment", self._deploy_container))
-            steps.append(("Schedule Setup", self._setup_schedule))
-
-        return steps
+        return [
+            (label, getattr(self, method_name))
+            for label, method_name, condition in self._STEP_SPECS
+            if condition is None or condition(self.config)
+        ]
 
     def _setup_ecr_repository(self) -> None:
         """Setup ECR repository"""
@@ -76,7 +89,7 @@ class ContainerDeployer(Deployer):
         # Update config with repository URI
         self.config.ecr_repository_uri = repo_uri
 
-        logger.info(f"✅ ECR repository ready: {repo_uri}")
+        logger.info("✅ ECR repository ready: %s", repo_uri)
 
     def _build_container(self) -> None:
         """Build and push Docker container"""
@@ -91,7 +104,7 @@ class ContainerDeployer(Deployer):
         if not success:
             raise RuntimeError("Container build failed")
 
-        logger.info(f"✅ Container built and pushed: {self.config.full_image_uri}")
+        logger.info("✅ Container built and pushed: %s", self.config.full_image_uri)
 
     def _test_container_locally(self) -> None:
         """Test container locally"""
@@ -108,24 +121,24 @@ class ContainerDeployer(Deployer):
         """Deploy container to Lambda"""
         logger.info("🚢 Deploying container to Lambda...")
 
+        cfg = self.config
+
         # Get environment variables
-        env_vars = self.config.get_env_vars()
+        env_vars = cfg.get_env_vars()
 
         # Deploy container Lambda
         function_arn = self.container_lambda_mgr.deploy_container_function(
-            function_name=self.config.function_name,
-            role_arn=self.config.role_arn,
-            image_uri=self.config.full_image_uri,
-            timeout=self.config.timeout,
-            memory_size=self.config.memory_size,
+            function_name=cfg.function_name,
+            role_arn=cfg.role_arn,
+            image_uri=cfg.full_image_uri,
+            timeout=cfg.timeout,
+            memory_size=cfg.memory_size,
             env_vars=env_vars,
-            architectures=self.config.architectures
+            architectures=cfg.architectures
         )
 
-        # Update config with Lambda ARN
-        self.config.lambda_arn = function_arn
-
-        logger.info(f"✅ Container deployed to Lambda: {function_arn}")
+        # config.lambda_arn is derived from region/account/name and already equals function_arn
+        logger.info("✅ Container deployed to Lambda: %s", function_arn)
 
     def _setup_iam_roles(self) -> None:
         """Setup IAM roles for container Lambda"""
@@ -142,26 +155,21 @@ class ContainerDeployer(Deployer):
         """Add ECR permissions to Lambda role for container pull"""
         logger.info("➕ Adding ECR permissions to Lambda role...")
 
+        cfg = self.config
+        region, account_id, repository = cfg.region, cfg.account_id, cfg.ecr_repository_name
+
         policy_name = 'ecr-pull-policy'
         policy_document = {
             "Version": "2012-10-17",
             "Statement": [{
                 "Effect": "Allow",
-                "Action": [
-                    "ecr:GetDownloadUrlForLayer",
-                    "ecr:BatchGetImage",
-                    "ecr:BatchCheckLayerAvailability"
-                ],
-                "Resource": f"arn:aws:ecr:{self.config.region}:{self.config.account_id}:repository/{self.config.ecr_repository_name}"
-            }, {
-                "Effect": "Allow",
-                "Action": "ecr:GetAuthorizationToken",
-                "Resource": "*"
-            }]
+                "Action": list(_ECR_PULL_ACTIONS),
+                "Resource": f"arn:aws:ecr:{region}:{account_id}:repository/{repository}"
+            }, _ECR_AUTH_STATEMENT]
         }
 
         self.iam_mgr.attach_inline_policy(
-            self.config.role_name,
+            cfg.role_name,
             policy_name,
             policy_document
         )
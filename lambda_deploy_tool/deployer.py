@@ -2,30 +2,54 @@
 """
 Generic deployment orchestrator - UPDATED with EventBridge Scheduler permission fix
 """
+import json
 import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional, List, Tuple, Callable, Any
+from typing import Optional, Dict, FrozenSet, List, Tuple, Callable, Any
 
 # Explicit imports to avoid circular dependencies
 from .aws.lambda_manager import LambdaManager
 from .aws.iam_manager import IAMManager
 from .aws.scheduler_manager import SchedulerManager
 from .aws.budget_manager import BudgetManager
-from .builder import LambdaBuilder
+from .aws.s3_manager import S3Manager
+from .builder import LambdaBuilder, file_sha256
 from .config import DeployConfig
 from .validators import AWSValidator, LambdaPackageValidator
 
 logger = logging.getLogger(__name__)
 
+_SEP = "-" * 60
+_HEAVY_SEP = "=" * 60
+
 
 class Deployer:
     """Generic deployment orchestrator"""
 
+    # With config.concurrent each step starts as soon as the steps it needs have finished.
+    # Steps not listed here (custom steps) wait for every step before them
+    STEP_DEPENDENCIES: Dict[str, FrozenSet[str]] = {
+        "Budget Setup": frozenset(),
+        "Build Package": frozenset(),
+        "IAM Setup": frozenset(),
+        "Local Test": frozenset({"Build Package"}),
+        "Lambda Deployment": frozenset({"Build Package", "IAM Setup", "Local Test"}),
+        "Schedule Setup": frozenset({"Lambda Deployment"}),
+    }
+    MAX_CONCURRENT_STEPS = 4
+    # Steps that touch deployed AWS resources; a local test run only builds and tests
+    LOCAL_TEST_SKIPPED_STEPS: FrozenSet[str] = frozenset({"IAM Setup", "Lambda Deployment", "Schedule Setup"})
+
     def __init__(self, config: DeployConfig):
         self.config = config
         self.account_id: Optional[str] = None
         self.deployment_steps: List[Tuple[str, Callable]] = []
         self.package_path: Optional[Path] = None
+        self.package_s3_key: Optional[str] = None
+        self.role_arns: Dict[str, str] = {}  # role name -> ARN, filled by IAM setup
+        self._build_future: Optional[Future] = None  # package build started ahead of its step
+        self._build_upload_sink = None  # S3 writer fed by that build, if any
 
         # Initialize with error handling
         self._initialize_aws_managers()
@@ -33,27 +57,62 @@ class Deployer:
     def _initialize_aws_managers(self) -> None:
         """Initialize AWS service managers with error handling"""
         try:
-            # Validate AWS and get account ID
-            aws_validator = AWSValidator(self.config.region)
-            self.account_id = aws_validator.validate()
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                # Validate AWS and get account ID (network round trip to STS)
+                account_future = executor.submit(AWSValidator(self.config.region).validate)
+
+                # Initialize AWS service managers and load their clients meanwhile
+                self.lambda_mgr = LambdaManager(self.config.region, self.config.dry_run)
+                self.iam_mgr = IAMManager(self.config.region, self.config.dry_run)
+                self.scheduler_mgr = SchedulerManager(self.config.region, self.config.dry_run)
+                self.s3_mgr = S3Manager(self.config.region, self.config.dry_run)
+                # One cheap read per service opens its TLS connection while STS answers, so the
+                # first real call of every step starts on a pooled, already-established socket.
+                # Dry runs and local tests make no AWS calls beyond STS
+                if not self.config.dry_run and not self.config.local_test_enabled:
+                    for manager, operation, kwargs in self._warm_up_calls():
+                        executor.submit(self._warm_up_client, manager, operation, kwargs)
+
+                # Initialize builder
+                self.builder = LambdaBuilder(self.config)
+
+                self.account_id = account_future.result()
+
             if not self.account_id:
                 raise ValueError("AWS validation failed - cannot get account ID")
 
-            self.config.account_id = self.account_id
-
-            # Initialize AWS service managers
-            self.lambda_mgr = LambdaManager(self.config.region, self.config.dry_run)
-            self.iam_mgr = IAMManager(self.config.region, self.config.dry_run)
-            self.scheduler_mgr = SchedulerManager(self.config.region, self.config.dry_run)
+            self.config.bind_account(self.account_id)
             self.budget_mgr = BudgetManager(self.config.region, self.account_id, self.config.dry_run)
 
-            # Initialize builder
-            self.builder = LambdaBuilder(self.config)
-
         except Exception as e:
-            logger.error(f"❌ Failed to initialize AWS managers: {e}")
+            logger.error("❌ Failed to initialize AWS managers: %s", e)
             raise
 
+    def _warm_up_calls(self) -> List[Tuple[Any, str, dict]]:
+        """
+        Reads the deployment makes anyway, so they need no extra permissions and a missing
+        resource is only a debug-level "not found" in safe_call
+        """
+        calls = [
+            (self.lambda_mgr, 'get_function', {'FunctionName': self.config.function_name}),
+            (self.iam_mgr, 'get_role', {'RoleName': self.config.role_name}),
+            (self.scheduler_mgr, 'get_schedule', {'Name': self.config.schedule_name}),
+        ]
+        if self.config.artifact_bucket:
+            calls.append((self.s3_mgr, 'head_bucket', {'Bucket': self.config.artifact_bucket}))
+        return calls
+
+    @staticmethod
+    def _warm_up_client(manager: Any, operation: str, kwargs: dict) -> None:
+        """
+        Create a boto3 client ahead of first use and open its connection with one read call
+        through the manager's safe_call; any answer has done the handshake, so errors are only logged
+        """
+        try:
+            manager.safe_call(operation, **kwargs)
+        except Exception as e:
+            logger.debug("Client warm-up failed for %s: %s", manager.service_name, e)
+
     def set_deployment_steps(self, steps: List[Tuple[str, Callable]]) -> None:
         """Set custom deployment steps"""
         self.deployment_steps = steps
@@ -78,15 +137,26 @@ class Deployer:
             self.deployment_steps = self.get_default_deployment_steps()
 
         try:
-            for step_name, step_func in self.deployment_steps:
-                if self._should_skip_step(step_name):
-                    continue
+            # A missing .env or required variable only surfaced at the deployment step, after the
+            # build and IAM work; resolve them now (.env is only parsed once)
+            if not self.config.local_test_enabled:
+                self.config.get_env_vars()
+
+            steps = [(name, func) for name, func in self.deployment_steps if not self._should_skip_step(name)]
+
+            if self.config.concurrent:
+                self._execute_steps_concurrently(steps)
+            else:
+                # The build needs nothing from AWS, so start it now and let the steps before
+                # "Build Package" run meanwhile; the step itself only waits for the result
+                if self._build_future is None and any(func == self._build_package for _, func in steps):
+                    self._start_package_build()
 
-                logger.info(f"\n📋 {step_name}")
-                logger.info("-" * 60)
+                for step_name, step_func in steps:
+                    logger.info("\n📋 %s", step_name)
+                    logger.info(_SEP)
 
-                if not self._execute_step_safely(step_name, step_func):
-                    raise ValueError(f"Deployment failed at step: {step_name}")
+                    self._execute_step_safely(step_name, step_func)
 
             logger.info("✅ Deployment completed successfully!")
 
@@ -94,7 +164,8 @@ class Deployer:
             self._show_deployment_summary()
 
         except Exception as e:
-            logger.error(f"❌ Deployment failed: {e}")
+            logger.error("❌ Deployment failed: %s", e)
+            self._discard_package_build()
             self._cleanup_on_failure()
             raise
 
@@ -104,51 +175,136 @@ class Deployer:
             return True
         if step_name == "Local Test" and not self.config.local_test_enabled:
             return True
-        if step_name in ["IAM Setup", "Lambda Deployment", "Schedule Setup"] and self.config.local_test_enabled:
+        if self.config.local_test_enabled and step_name in self.LOCAL_TEST_SKIPPED_STEPS:
             return True
         return False
 
-    def _execute_step_safely(self, step_name: str, step_func) -> bool:
-        """Execute a deployment step with error handling"""
+    def _execute_steps_concurrently(self, steps: List[Tuple[str, Callable]]) -> None:
+        """
+        Run steps as a dependency graph on threads (their AWS calls and the local build overlap):
+        a step is submitted once everything it depends on has succeeded, so e.g. the Lambda
+        deployment starts as soon as build and IAM are done, without waiting for the budget
+        """
+        names = {name for name, _ in steps}
+        pending: Dict[str, Tuple[Callable, FrozenSet[str]]] = {}
+        for index, (name, func) in enumerate(steps):
+            dependencies = self.STEP_DEPENDENCIES.get(name)
+            if dependencies is None:
+                dependencies = frozenset(previous for previous, _ in steps[:index])
+            # Skipped steps are not waited for
+            pending[name] = (func, dependencies & names)
+
+        completed = set()
+        running = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=min(self.MAX_CONCURRENT_STEPS, len(steps))) as executor:
+            while pending or running:
+                # After a failure nothing new starts; steps already running are allowed to finish
+                if error is None:
+                    for name in [name for name, (_, dependencies) in pending.items() if dependencies <= completed]:
+                        func, _ = pending.pop(name)
+                        logger.info("\n📋 %s (concurrent)", name)
+                        logger.info(_SEP)
+                        running[executor.submit(self._execute_step_safely, name, func)] = name
+
+                if not running:
+                    break
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    if future.exception() is None:
+                        completed.add(name)
+                    elif error is None:
+                        error = future.exception()
+
+        if error is not None:
+            raise error
+        if pending:
+            raise ValueError(f"Deployment steps with unsatisfiable dependencies: {', '.join(pending)}")
+
+    def _execute_step_safely(self, step_name: str, step_func) -> None:
+        """Execute a deployment step, logging its failure once under the step name"""
         try:
             step_func()
-            return True
         except Exception as e:
-            logger.error(f"❌ {step_name} failed: {e}")
+            logger.error("❌ %s failed: %s", step_name, e)
             raise
 
     def _setup_budget_if_needed(self) -> None:
-        """Setup budget enforcement with error handling"""
+        """Setup budget enforcement"""
         if not self.config.enable_budget or self.config.local_test_enabled:
             return
 
         logger.info("💰 Setting up Budget Enforcement")
 
-        try:
-            # Create budget action role first
-            budget_role_arn = self.iam_mgr.ensure_budget_action_role(
-                f'{self.config.function_name}-budget-action-role',
-                self.config.account_id
-            )
-            self.iam_mgr.attach_budget_action_policy(f'{self.config.function_name}-budget-action-role')
-
-            # Setup budget with enforcement
-            self.budget_mgr.setup_budget_enforcement(
-                budget_name=self.config.budget_name,
-                budget_limit=self.config.budget_limit,
-                email=self.config.budget_email,
-                budget_action_role_arn=budget_role_arn,
-                sns_topic_name=self.config.budget_topic_name
-            )
-
-        except Exception as e:
-            logger.error(f"❌ Budget setup failed: {e}")
-            raise
+        # Create budget action role first
+        budget_role_arn = self.iam_mgr.ensure_budget_action_role(
+            f'{self.config.function_name}-budget-action-role',
+            self.config.account_id
+        )
+        self.iam_mgr.attach_budget_action_policy(f'{self.config.function_name}-budget-action-role')
+
+        # Setup budget with enforcement
+        self.budget_mgr.setup_budget_enforcement(
+            budget_name=self.config.budget_name,
+            budget_limit=self.config.budget_limit,
+            email=self.config.budget_email,
+            budget_action_role_arn=budget_role_arn,
+            sns_topic_name=self.config.budget_topic_name
+        )
 
     def _build_package(self) -> None:
         """Build Lambda package with error handling"""
         logger.info("📦 Building Lambda Package")
-        self.package_path = self.builder.build()
+
+        if self._build_future is None:
+            self.package_path = self._run_build(self._package_upload_sink())
+            return
+
+        build_future, self._build_future = self._build_future, None
+        self._build_upload_sink = None
+        self.package_path = build_future.result()
+
+    def _start_package_build(self) -> None:
+        """Start building the package on a background thread; _build_package collects the result"""
+        self._build_upload_sink = self._package_upload_sink()
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._build_future = executor.submit(self._run_build, self._build_upload_sink)
+        executor.shutdown(wait=False)
+
+    def _discard_package_build(self) -> None:
+        """
+        Stop a background build whose step will never run: cancel its upload (the builder then
+        aborts it) and wait for the thread, so no multipart upload or worker outlives the failure
+        """
+        if self._build_future is None:
+            return
+
+        build_future, self._build_future = self._build_future, None
+        upload_sink, self._build_upload_sink = self._build_upload_sink, None
+        if upload_sink is not None:
+            upload_sink.cancel()
+        if not build_future.done():
+            logger.info("Waiting for the background package build to stop...")
+        # Its outcome no longer matters; exception() just waits without raising
+        build_future.exception()
+
+    def _run_build(self, upload_sink) -> Path:
+        """Build the package, aborting upload_sink if the build fails before it is written"""
+        try:
+            return self.builder.build(upload_sink)
+        except BaseException:
+            if upload_sink is not None:
+                upload_sink.abort()
+            raise
+
+    def _package_upload_sink(self):
+        """Upload to S3 while compressing instead of sending the zip afterwards"""
+        if self.config.artifact_bucket and not self.config.dry_run and not self.config.local_test_enabled:
+            self.package_s3_key = f"{self.config.function_name}/{self.config.package_name}"
+            return self.s3_mgr.multipart_writer(self.config.artifact_bucket, self.package_s3_key)
+        return None
 
     def _run_local_test_if_enabled(self) -> None:
         """Run local Lambda test if enabled"""
@@ -174,58 +330,71 @@ class Deployer:
             raise ValueError("Local Lambda test failed")
 
     def _setup_iam_roles(self) -> None:
-        """Setup IAM roles with error handling"""
+        """Setup IAM roles"""
         logger.info("👤 Setting up IAM Roles")
 
-        try:
-            # Lambda execution role
-            role_arn = self.iam_mgr.ensure_lambda_role(
-                self.config.role_name,
-                self.config.account_id
-            )
-
-            # Scheduler role
-            scheduler_role_name = f'{self.config.function_name}-schedule-role'
-            scheduler_role_arn = self.iam_mgr.ensure_scheduler_role(
-                scheduler_role_name,
-                self.config.account_id,
-                self.config.function_name
-            )
-
-        except Exception as e:
-            logger.error(f"❌ IAM setup failed: {e}")
-            raise
+        # Lambda execution role and scheduler role are independent, set them up concurrently
+        role_arns = self.iam_mgr.ensure_all_roles([
+            ('lambda', self.config.role_name, {'account_id': self.config.account_id}),
+            ('scheduler', self.config.scheduler_role_name, {
+                'account_id': self.config.account_id,
+                'function_name': self.config.function_name
+            }),
+        ])
+        self.role_arns.update(role_arns)
 
     def _deploy_lambda(self) -> None:
         """Deploy Lambda function with environment variable validation"""
         logger.info("⚡ Deploying Lambda Function")
 
-        try:
-            env_vars = self.config.get_env_vars()
-
-            # Validate environment variable size before deployment
-            if not self.config.validate_env_vars_size(env_vars):
-                env_size = sum(len(k) + len(v) for k, v in env_vars.items())
-                raise ValueError(
-                    f"Environment variables exceed Lambda 4KB limit (estimated: {env_size} bytes)."
-                )
-
-            function_arn = self.lambda_mgr.deploy_function(
-                function_name=self.config.function_name,
-                role_arn=self.config.role_arn,
-                handler=self.config.handler,
-                runtime=self.config.runtime,
-                timeout=self.config.timeout,
-                memory_size=self.config.memory_size,
-                env_vars=env_vars,
-                package_path=self.package_path
+        env_vars = self.config.get_env_vars()
+
+        # Validate environment variable size before deployment
+        env_size = self.config.env_vars_size(env_vars)
+        if not self.config.validate_env_vars_size(env_vars, env_size):
+            raise ValueError(
+                f"Environment variables exceed Lambda 4KB limit (estimated: {env_size} bytes)."
             )
 
-            logger.info(f"✅ Lambda function deployed: {function_arn}")
+        source_hash = self._compute_source_hash(env_vars)
+        if not self.config.force_deploy and \
+                self.lambda_mgr.get_source_hash(self.config.function_name) == source_hash:
+            logger.info("✅ No changes since last deployment - skipping code and configuration upload")
+            return
 
-        except Exception as e:
-            logger.error(f"❌ Lambda deployment failed: {e}")
-            raise
+        function_arn = self.lambda_mgr.deploy_function(
+            function_name=self.config.function_name,
+            role_arn=self.config.role_arn,
+            handler=self.config.handler,
+            runtime=self.config.runtime,
+            timeout=self.config.timeout,
+            memory_size=self.config.memory_size,
+            env_vars=env_vars,
+            package_path=self.package_path,
+            s3_bucket=self.config.artifact_bucket,
+            s3_key=self.package_s3_key,
+            architectures=self.config.architectures
+        )
+
+        if not self.config.dry_run:
+            self.lambda_mgr.set_source_hash(function_arn, source_hash)
+
+        logger.info("✅ Lambda function deployed: %s", function_arn)
+
+    def _compute_source_hash(self, env_vars: dict) -> str:
+        """Hash the package together with every setting deploy_function sends"""
+        digest = file_sha256(self.package_path)
+        settings = {
+            'handler': self.config.handler,
+            'runtime': self.config.runtime,
+            'role_arn': self.config.role_arn,
+            'timeout': self.config.timeout,
+            'memory_size': self.config.memory_size,
+            'architectures': self.config.architectures,
+            'env_vars': env_vars,
+        }
+        digest.update(json.dumps(settings, sort_keys=True).encode())
+        return digest.hexdigest()
 
     def _add_scheduler_permission_to_lambda(self) -> None:
         """
@@ -253,42 +422,29 @@ class Deployer:
         except self.lambda_mgr.client.exceptions.ResourceConflictException:
             logger.info("✅ EventBridge Scheduler permission already exists")
         except Exception as e:
-            logger.error(f"❌ Failed to add EventBridge Scheduler permission: {e}")
+            logger.error("❌ Failed to add EventBridge Scheduler permission: %s", e)
             raise
 
     def _setup_schedule(self) -> None:
         """Setup EventBridge schedule with error handling"""
         logger.info("⏰ Setting up EventBridge Schedule")
 
-        try:
-            scheduler_role_name = f'{self.config.function_name}-schedule-role'
-            scheduler_role_arn = f"arn:aws:iam::{self.config.account_id}:role/{scheduler_role_name}"
+        scheduler_role_arn = self.role_arns.get(self.config.scheduler_role_name) or self.config.scheduler_role_arn
 
-            # ✅ ADD PERMISSION FIRST (before creating/updating schedule)
-            self._add_scheduler_permission_to_lambda()
+        # ✅ ADD PERMISSION FIRST (before creating/updating schedule)
+        self._add_scheduler_permission_to_lambda()
 
-            # Get optional schedule timezone from config (if supported)
-            schedule_timezone = getattr(self.config, 'schedule_timezone', None)
+        # Optional schedule description (default to function name)
+        schedule_description = self.config.schedule_description or f'{self.config.function_name} execution schedule'
 
-            # Get optional schedule description (default to function name)
-            schedule_description = getattr(
-                self.config,
-                'schedule_description',
-                f'{self.config.function_name} execution schedule'
-            )
-
-            self.scheduler_mgr.ensure_schedule(
-                schedule_name=self.config.schedule_name,
-                schedule_expression=self.config.schedule_expression,
-                target_arn=self.config.lambda_arn,
-                role_arn=scheduler_role_arn,
-                schedule_timezone=schedule_timezone,
-                description=schedule_description
-            )
-
-        except Exception as e:
-            logger.error(f"❌ Schedule setup failed: {e}")
-            raise
+        self.scheduler_mgr.ensure_schedule(
+            schedule_name=self.config.schedule_name,
+            schedule_expression=self.config.schedule_expression,
+            target_arn=self.config.lambda_arn,
+            role_arn=scheduler_role_arn,
+            schedule_timezone=self.config.schedule_timezone,
+            description=schedule_description
+        )
 
     def _cleanup_on_failure(self) -> None:
         """Cleanup resources on deployment failure"""
@@ -300,9 +456,9 @@ class Deployer:
 
     def _show_deployment_summary(self) -> None:
         """Show deployment summary after successful deployment"""
-        logger.info("\n" + "=" * 60)
+        logger.info("\n" + _HEAVY_SEP)
         logger.info("🎉 DEPLOYMENT COMPLETE!")
-        logger.info("=" * 60)
+        logger.info(_HEAVY_SEP)
 
         # Skip summary for local test mode or dry run
         if self.config.local_test_enabled or self.config.dry_run:
@@ -310,22 +466,22 @@ class Deployer:
 
         # Show next steps
         logger.info("\n🔍 Next Steps:")
-        logger.info(f"  Test: aws lambda invoke --function-name {self.config.function_name} --region {self.config.region} --invocation-type Event response.json")
-        logger.info(f"  Logs: aws logs tail /aws/lambda/{self.config.function_name} --region {self.config.region} --follow")
+        logger.info("  Test: aws lambda invoke --function-name %s --region %s --invocation-type Event response.json", self.config.function_name, self.config.region)
+        logger.info("  Logs: aws logs tail /aws/lambda/%s --region %s --follow", self.config.function_name, self.config.region)
 
-        logger.info(
-            f"  Monitor: https://console.aws.amazon.com/lambda/home?region={self.config.region}#/functions/{self.config.function_name}")
+        logger.info("  Monitor: https://console.aws.amazon.com/lambda/home?region=%s#/functions/%s",
+                    self.config.region, self.config.function_name)
 
         # Show budget reminder if enabled
         if self.config.enable_budget and self.config.budget_email:
-            logger.info(f"\n📧 IMPORTANT: Confirm SNS subscription in {self.config.budget_email}")
-            if hasattr(self.config, 'budget_topic_name') and self.config.budget_topic_name:
-                logger.info(f"  SNS Topic: {self.config.budget_topic_name}")
+            logger.info("\n📧 IMPORTANT: Confirm SNS subscription in %s", self.config.budget_email)
+            if self.config.budget_topic_name:
+                logger.info("  SNS Topic: %s", self.config.budget_topic_name)
 
     def build(self):
         """Build Lambda package (public method for build-only mode)"""
         logger.info("\n📦 Building Lambda Package")
-        logger.info("-" * 60)
+        logger.info(_SEP)
 
         package_path = self.builder.build()
         self.package_path = package_path
@@ -334,4 +490,9 @@ class Deployer:
         if not self.builder.verify_package(package_path):
             raise ValueError("Package verification failed")
 
+        # A deploy() following this hands the package to its Build Package step instead of
+        # rebuilding; deploy_function uploads it to the artifact bucket itself when needed
+        self._build_future = Future()
+        self._build_future.set_result(package_path)
+
         return package_path
\ No newline at end of file
@@ -3,24 +3,45 @@
 Generic validators for AWS Lambda deployment
 Single Responsibility: Each validator checks one thing
 """
+import importlib
 import json
 import logging
 import os
 import sys
+import threading
+import time
 import zipfile
+import zipimport
+from contextlib import ExitStack
+from dataclasses import dataclass
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import Optional, Callable, Any
+from typing import Optional, Callable, Any, Dict, Tuple
+
+from .config import _DATACLASS_SLOTS
 
 logger = logging.getLogger(__name__)
 
+# zipimport cannot load these; a package containing any is extracted for the local test
+_NATIVE_EXTENSION_SUFFIXES = ('.so', '.pyd')
+
 
 class AWSValidator:
     """Validates AWS credentials and access (SRP)"""
 
+    # access key -> (expiry, account ID); the account behind a set of credentials does not change
+    _account_cache: Dict[str, Tuple[float, str]] = {}
+    _account_cache_lock = threading.Lock()
+
     def __init__(self, region: str):
         self.region = region
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget every validated account, e.g. after switching credentials in-process"""
+        with cls._account_cache_lock:
+            cls._account_cache.clear()
+
     def validate(self) -> Optional[str]:
         """
         Validate AWS credentials and return account ID
@@ -29,16 +50,29 @@ class AWSValidator:
         logger.info("Validating AWS credentials...")
 
         try:
-            import boto3
+            # Imported here so the other validators do not pull in boto3/botocore
             from botocore.exceptions import ClientError, NoCredentialsError
 
-            sts = boto3.client('sts', region_name=self.region)
-            identity = sts.get_caller_identity()
-            account_id = identity['Account']
-
-            logger.info(f"✅ AWS credentials valid")
-            logger.info(f"  Account: {account_id}")
-            logger.info(f"  Region: {self.region}")
+            from .aws import CACHE_TTL_SECONDS, get_client, get_session
+
+            # Repeated validations with the same credentials skip the STS round trip
+            credentials = get_session().get_credentials()
+            access_key = credentials.access_key if credentials is not None else None
+            with self._account_cache_lock:
+                cached = self._account_cache.get(access_key)
+            if cached is not None and cached[0] > time.monotonic():
+                account_id = cached[1]
+            else:
+                sts = get_client('sts', self.region)
+                identity = sts.get_caller_identity()
+                account_id = identity['Account']
+                if access_key is not None:
+                    with self._account_cache_lock:
+                        self._account_cache[access_key] = (time.monotonic() + CACHE_TTL_SECONDS, account_id)
+
+            logger.info("✅ AWS credentials valid")
+            logger.info("  Account: %s", account_id)
+            logger.info("  Region: %s", self.region)
 
             return account_id
 
@@ -47,13 +81,27 @@ class AWSValidator:
             logger.info("💡 Please configure AWS CLI using: aws configure")
             return None
         except ClientError as e:
-            logger.error(f"❌ AWS credentials invalid: {e}")
+            logger.error("❌ AWS credentials invalid: %s", e)
             return None
         except Exception as e:
-            logger.error(f"❌ Error validating AWS credentials: {e}")
+            logger.error("❌ Error validating AWS credentials: %s", e)
             return None
 
 
+@dataclass(**_DATACLASS_SLOTS)
+class _MockContext:
+    """Stand-in for the Lambda context object passed to the handler in local tests"""
+    function_name: str = "lambda-local-test"
+    memory_limit_in_mb: int = 512
+    function_version: str = "$LATEST"
+    invoked_function_arn: str = "arn:aws:lambda:us-east-1:123456789012:function:lambda-local-test"
+    aws_request_id: str = "test-request-id"
+
+    @staticmethod
+    def remaining_time_in_millis() -> int:
+        return 300000
+
+
 class LambdaPackageValidator:
     """Validates Lambda package locally (Generic - SRP)"""
 
@@ -64,28 +112,64 @@ class LambdaPackageValidator:
 
     def validate(self) -> bool:
         """Test Lambda package locally"""
-        logger.info(f"Testing Lambda package locally...")
+        logger.info("Testing Lambda package locally...")
 
         if not self.package_path.exists():
-            logger.error(f"❌ Package not found: {self.package_path}")
+            logger.error("❌ Package not found: %s", self.package_path)
             return False
 
         return self._test_lambda_handler()
 
+    def _import_path(self, stack: ExitStack) -> str:
+        """
+        sys.path entry to import the handler from: the zip itself (zipimport reads members on
+        demand), or an extracted copy when the package holds native extensions, which can only
+        be loaded from disk.
+        Imported from the zip, module __file__ paths point inside the archive, so a handler that
+        opens data files relative to __file__ fails here although it works on Lambda; such
+        packages need pkgutil/importlib.resources reads to be tested locally
+        """
+        with zipfile.ZipFile(self.package_path, 'r') as zipf:
+            if not any(name.endswith(_NATIVE_EXTENSION_SUFFIXES) for name in zipf.NameToInfo):
+                import_path = str(self.package_path)
+                # zipimport caches an archive's directory (member offsets) by path; a package
+                # rebuilt at the same path must not be read through the previous build's index
+                zipimport._zip_directory_cache.pop(import_path, None)
+                sys.path_importer_cache.pop(import_path, None)
+                importlib.invalidate_caches()
+                return import_path
+
+            temp_dir = stack.enter_context(TemporaryDirectory())
+            zipf.extractall(temp_dir)
+            return temp_dir
+
+    def _pop_handler_modules(self) -> Dict[str, Any]:
+        """Remove the handler's top-level package and its submodules from sys.modules, returning them"""
+        top_level = self.handler_module.split('.', 1)[0]
+        names = [name for name in sys.modules if name == top_level or name.startswith(top_level + '.')]
+        return {name: sys.modules.pop(name) for name in names}
+
+    @staticmethod
+    def _forget_package_modules(import_path: str) -> None:
+        """Drop every module imported from the package, so a later test imports the new build"""
+        prefix = import_path + os.sep
+        for name, module in list(sys.modules.items()):
+            if (getattr(module, '__file__', None) or '').startswith(prefix):
+                del sys.modules[name]
+
     def _test_lambda_handler(self) -> bool:
         """Test Lambda handler with local execution (Generic)"""
         try:
-            with TemporaryDirectory() as temp_dir:
-                # Extract package
-                with zipfile.ZipFile(self.package_path, 'r') as zipf:
-                    zipf.extractall(temp_dir)
+            with ExitStack() as stack:
+                import_path = self._import_path(stack)
 
                 # Add to Python path
-                sys.path.insert(0, temp_dir)
+                sys.path.insert(0, import_path)
+                # Import the handler fresh from this package, not a module cached by an earlier test
+                shadowed = self._pop_handler_modules()
 
                 try:
                     # Dynamically import the handler module
-                    import importlib
                     module = importlib.import_module(self.handler_module)
 
                     # Get the handler function
@@ -97,41 +181,33 @@ class LambdaPackageValidator:
                         "source": "local_test"
                     }
 
-                    class MockContext:
-                        def __init__(self):
-                            self.function_name = "lambda-local-test"
-                            self.memory_limit_in_mb = 512
-                            self.remaining_time_in_millis = lambda: 300000
-                            self.function_version = "$LATEST"
-                            self.invoked_function_arn = "arn:aws:lambda:us-east-1:123456789012:function:lambda-local-test"
-                            self.aws_request_id = "test-request-id"
-
                     # Invoke handler
-                    logger.info(f"Invoking Lambda handler {self.handler_module}.{self.handler_function} locally...")
-                    result = handler(test_event, MockContext())
+                    logger.info("Invoking Lambda handler %s.%s locally...", self.handler_module, self.handler_function)
+                    result = handler(test_event, _MockContext())
 
                     if result:
-                        logger.info(f"✅ Local Lambda test passed. Handler returned: {result}")
+                        logger.info("✅ Local Lambda test passed. Handler returned: %s", result)
                         return True
                     else:
-                        logger.error(f"❌ Local Lambda test failed: Handler returned None")
+                        logger.error("❌ Local Lambda test failed: Handler returned None")
                         return False
 
                 except ImportError as e:
-                    logger.error(f"❌ Failed to import handler module '{self.handler_module}': {e}")
+                    logger.error("❌ Failed to import handler module '%s': %s", self.handler_module, e)
                     return False
                 except AttributeError as e:
-                    logger.error(f"❌ Handler function '{self.handler_function}' not found: {e}")
+                    logger.error("❌ Handler function '%s' not found: %s", self.handler_function, e)
                     return False
                 finally:
                     # Cleanup
-                    if temp_dir in sys.path:
-                        sys.path.remove(temp_dir)
+                    if import_path in sys.path:
+                        sys.path.remove(import_path)
+                    self._forget_package_modules(import_path)
+                    sys.modules.update(shadowed)
 
         except Exception as e:
-            logger.error(f"❌ Local Lambda test failed: {e}")
-            import traceback
-            logger.debug(traceback.format_exc())
+            logger.error("❌ Local Lambda test failed: %s", e)
+            logger.debug("Local Lambda test traceback", exc_info=True)
             return False
 
 
@@ -146,24 +222,19 @@ class EnvironmentVariableValidator:
         """Validate environment variables"""
         logger.info("Validating environment variables...")
 
-        missing_vars = []
-        for var in self.required_vars:
-            if not os.getenv(var):
-                missing_vars.append(var)
+        env = os.environ
+        missing_vars = [var for var in self.required_vars if not env.get(var)]
 
         if missing_vars:
-            logger.error(f"❌ Missing required environment variables: {', '.join(missing_vars)}")
+            logger.error("❌ Missing required environment variables: %s", ', '.join(missing_vars))
             return False
 
-        logger.info(f"✅ Found {len(self.required_vars)} required environment variables")
+        logger.info("✅ Found %s required environment variables", len(self.required_vars))
 
         # Check optional variables (warn if missing)
-        missing_optional = []
-        for var in self.optional_vars:
-            if not os.getenv(var):
-                missing_optional.append(var)
+        missing_optional = [var for var in self.optional_vars if not env.get(var)]
 
         if missing_optional:
-            logger.warning(f"⚠️  Missing optional environment variables: {', '.join(missing_optional)}")
+            logger.warning("⚠️  Missing optional environment variables: %s", ', '.join(missing_optional))
 
         return True
\ No newline at end of file
@@ -2,8 +2,11 @@
 
 from setuptools import setup, find_packages
 
-with open("README.md", "r", encoding="utf-8") as fh:
-    long_description = fh.read()
+try:
+    with open("README.md", "r", encoding="utf-8") as fh:
+        long_description = fh.read()
+except FileNotFoundError:
+    long_description = ""
 
 setup(
     name="lambda-deploy-tool",
@@ -13,12 +16,15 @@ setup(
     description="Generic AWS Lambda deployment toolkit",
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    packages=find_packages(include=["lambda_deploy_tool", "lambda_deploy_tool.*"]),
     install_requires=[
         "boto3>=1.34.0",
         "botocore>=1.34.0",
         "python-dotenv>=1.0.0",
     ],
+    extras_require={
+        "fast": ["deflate>=0.7.0", "zlib-ng>=0.4.0"],
+    },
     python_requires=">=3.9",
     classifiers=[
         "Development Status :: 4 - Beta",